@@ -0,0 +1,102 @@
+import re
+from datetime import date
+from typing import List, NamedTuple, Optional
+
+from app.core.config import COUPON_ROW_LABELS
+from app.core.table_readers import TableRow
+from app.processors.field_index import normalize_field_key
+from app.utils.date_utils import DATE_FORMATS, parse_date
+from app.utils.number_tokens import tokenize_numbers
+
+# Date spellings used in coupon and cash-flow schedules, on top of the term sheet formats
+SCHEDULE_DATE_FORMATS = DATE_FORMATS + ("%d-%b-%Y", "%d-%B-%Y", "%d-%m-%Y", "%d.%m.%Y", "%d %b %Y", "%b %d, %Y")
+
+# Characters left in a plain amount cell once its number is removed: "Rs. 4,250/-"
+_AMOUNT_RESIDUE_RE = re.compile(r'(?:\b(?:Rs|INR)\.?|₹|[\s/,.\-])+', re.IGNORECASE)
+
+# A schedule label, optionally numbered, as left by normalize_field_key
+_COUPON_LABEL_RE = re.compile(r'(?:' + '|'.join(map(re.escape, COUPON_ROW_LABELS)) + r')\d*')
+
+
+class CouponRecord(NamedTuple):
+    """One coupon or cash-flow row of a term sheet"""
+    label: str                  # Row label as written: "Coupon", "Cash Flow 3", ...
+    description: str            # Cells that are neither a date, a rate nor an amount
+    date: Optional[date]
+    rate: Optional[float]       # Percent: 8.5 for "8.50% p.a."
+    amount: Optional[float]     # Rupees
+    text: str                   # The row's value cells joined with " | "
+
+
+def is_coupon_row(row: TableRow) -> bool:
+    """Three or more columns with a coupon or cash-flow label ("Coupon", "Cash Flow 3") in the first one"""
+    if row.num_cols < 3:
+        return False
+    return _COUPON_LABEL_RE.fullmatch(normalize_field_key(row.cells[0])) is not None
+
+
+def parse_coupon_row(row: TableRow) -> Optional[CouponRecord]:
+    """Type the value cells of a coupon row; None if they are all empty"""
+    values = [cell for cell in row.cells[1:] if cell]
+    if not values:
+        return None
+
+    # Schedules list the amount last ("Date | No of days | Amount"), so of several
+    # plain numbers the last is the amount and the others stay in the description
+    described: List[str] = []
+    amount_cell = None
+    record_date = rate = amount = None
+    for cell in values:
+        if rate is None and '%' in cell:
+            rate = _parse_rate(cell)
+            if rate is not None:
+                continue
+        if record_date is None:
+            parsed = parse_date(cell, SCHEDULE_DATE_FORMATS)
+            if parsed:
+                record_date = parsed.date()
+                continue
+        parsed_amount = _parse_amount(cell)
+        if parsed_amount is not None:
+            if amount_cell is not None:
+                described.append(amount_cell)
+            amount, amount_cell = parsed_amount, cell
+            continue
+        described.append(cell)
+
+    descriptions: List[str] = []
+    for cell in described:
+        if cell not in descriptions:
+            descriptions.append(cell)
+
+    return CouponRecord(
+        label=row.cells[0],
+        description=' | '.join(descriptions),
+        date=record_date,
+        rate=rate,
+        amount=amount,
+        text=' | '.join(values),
+    )
+
+
+def _parse_rate(cell: str) -> Optional[float]:
+    """The number directly in front of a percent sign"""
+    for token in tokenize_numbers(cell):
+        if cell[token.end:].lstrip().startswith('%'):
+            return float(token.number)
+    return None
+
+
+def _parse_amount(cell: str) -> Optional[float]:
+    """A cell holding just a (currency) amount, e.g. "Rs. 4,250/-" or "4,250.00" """
+    tokens = tokenize_numbers(cell)
+    if len(tokens) != 1:
+        return None
+    token = tokens[0]
+    residue = cell[:token.start] + cell[token.end:]
+    if token.currency or not _AMOUNT_RESIDUE_RE.sub('', residue):
+        try:
+            return float(token.number)
+        except ValueError:
+            return None
+    return None
@@ -1,81 +1,69 @@
-from typing import Dict, List, Tuple
+from typing import List, Optional, Tuple
+from app.core.coupon_schedule import CouponRecord, parse_coupon_row
+from app.core.phrase_matcher import PhraseMatcher
+from app.core.table_readers import TableRow
 
 class ExtractionStrategy:
+    # Strategies read the cached forms on TableRow: `cells` is already stripped and
+    # whitespace-normalized, `folded` is its casefolded copy and `non_empty` the mask.
+    # Skip phrases and valid headers are checked with the processor's PhraseMatcher.
+
     @staticmethod
-    def apply_strategy1(cells: List[str], valid_headers: List[str], skip_phrases: List[str]) -> Tuple[str, str, str]:
+    def apply_strategy1(row: TableRow, matcher: PhraseMatcher) -> Tuple[str, str, str]:
         """Strategy 1: Find key-value pairs in adjacent columns"""
-        num_cols = len(cells)
+        cells, non_empty = row.cells, row.non_empty
+        num_cols = row.num_cols
         key = value = extraction_method = ""
         
         if num_cols >= 2:
             for i in range(num_cols - 1):
-                if cells[i].strip():
-                    cell_lower = cells[i].lower()
-                    if (not any(phrase in cell_lower for phrase in skip_phrases) or 
-                        any(header in cell_lower for header in valid_headers)):
-                        key = cells[i].strip()
-                        if num_cols > 2 and cells[1].strip() and cells[2].strip():
-                            value = f"{cells[1].strip()} | {cells[2].strip()}" if cells[1].strip() != cells[2].strip() else cells[1].strip()
+                if non_empty[i]:
+                    if matcher.is_key_cell(row.folded[i]):
+                        key = cells[i]
+                        if num_cols > 2 and non_empty[1] and non_empty[2]:
+                            value = f"{cells[1]} | {cells[2]}" if cells[1] != cells[2] else cells[1]
                         else:
-                            value = cells[i+1].strip()
+                            value = cells[i+1]
                         extraction_method = f"Strategy1_Col{i+1}→Col{i+2}"
                         break
         
         return key, value, extraction_method
     
     @staticmethod
-    def apply_strategy2(cells: List[str], valid_headers: List[str], skip_phrases: List[str]) -> Tuple[str, str, str]:
+    def apply_strategy2(row: TableRow, matcher: PhraseMatcher) -> Tuple[str, str, str]:
         """Strategy 2: Handle single column with meaningful content"""
-        num_cols = len(cells)
+        num_cols = row.num_cols
         key = value = extraction_method = ""
-        if not key and num_cols >= 1:
-            for i, cell in enumerate(cells):
-                cell_lower = cell.strip().lower()
-                if (cell.strip() and 
-                    not any(skip in cell_lower for skip in skip_phrases) or
-                    any(header in cell_lower for header in valid_headers)):
-                    if len(cell.strip()) > 3:  # Avoid very short strings
-                        key = cell.strip()  # Use actual content instead of Field_X_Y_Z
-                        value = cell.strip()
-                        extraction_method = f"Single_Col{i+1}"
+        if num_cols >= 1:
+            # The last qualifying cell wins, so scan from the end and stop at the first hit
+            for i in range(num_cols - 1, -1, -1):
+                cell = row.cells[i]
+                if row.non_empty[i] and len(cell) > 3 and matcher.is_key_cell(row.folded[i]):  # Avoid very short strings
+                    key = cell  # Use actual content instead of Field_X_Y_Z
+                    value = cell
+                    extraction_method = f"Single_Col{i+1}"
+                    break
         return key, value, extraction_method
     
     @staticmethod
-    def apply_strategy3(cells: List[str], data_dict) -> Tuple[str, str, str]:
-        """Strategy 3: Handle multi-column data (3+ columns) which is different"""
-        num_cols = len(cells)
+    def apply_strategy3(row: TableRow, coupon_records: Optional[List[CouponRecord]] = None) -> Tuple[str, str, str]:
+        """Strategy 3: Coupon and cash-flow rows (3+ columns), also collected as typed records"""
+        cells = row.cells
         key = value = extraction_method = ""
-        if not key and num_cols >= 3:
-            # Check if this is a Coupon row
-            first_cell = cells[0].strip().lower() if cells[0] else ""
-            
-            if first_cell == 'coupon':
-                # Initialize coupon data structure if not exists
-                if 'coupon_data' not in data_dict:
-                    data_dict['coupon_data'] = []
-                
-                # Get description and value from columns 2 and 3
-                description = cells[1].strip() if len(cells) > 1 else ""
-                value = cells[2].strip() if len(cells) > 2 else ""
-                
-                if description or value:
-                    # Store complete information
-                    combined_value = ""
-                    if description and value:
-                        combined_value = f"{description} | {value}"
-                    elif description:
-                        combined_value = description
-                    elif value:
-                        combined_value = value
-                    
-                    if combined_value:
-                        data_dict['coupon_data'].append(combined_value)
-                        
-                        # Determine if this is first or second coupon entry
-                        coupon_key = 'Coupon' if 'Coupon' not in data_dict else 'Coupon_1'
-                        data_dict[coupon_key] = combined_value
-                        
-                # Set method for debug info
-                extraction_method = "Coupon_Special"
-                
-        return key, value, extraction_method
\ No newline at end of file
+        if row.num_cols >= 3:
+            # Label in column 1, description and value in columns 2 and 3
+            key = cells[0]
+            description, amount = cells[1], cells[2]
+            if description and amount:
+                value = f"{description} | {amount}" if description != amount else description
+            else:
+                value = description or amount
+            extraction_method = "Coupon_Special"
+
+            # The full row goes to the Coupon_Schedule sheet as one typed record
+            if coupon_records is not None:
+                record = parse_coupon_row(row)
+                if record:
+                    coupon_records.append(record)
+
+        return key, value, extraction_method
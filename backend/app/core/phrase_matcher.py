@@ -0,0 +1,68 @@
+import re
+from typing import Dict, FrozenSet, Iterable, Optional
+
+SKIP = 'skip'
+HEADER = 'header'
+
+_NO_HITS: FrozenSet[str] = frozenset()
+
+# Bound on memoized key-cell verdicts; labels repeat heavily across rows and documents
+_KEY_CELL_CACHE_SIZE = 4096
+
+
+class PhraseMatcher:
+    """Match many phrases against a cell in one scan.
+
+    All phrases are compiled into a single alternation tried at every position of the
+    text, longest phrase first. Phrases that match at the same position are prefixes of
+    one another, so each phrase is mapped to its own categories plus those of every
+    phrase that is a prefix of it; the longest match at a position then reports every
+    category hit there, including overlapping phrases.
+    """
+
+    def __init__(self, phrase_sets: Dict[str, Iterable[str]]):
+        """
+        Args:
+            phrase_sets (dict): Category name -> phrases, e.g. {SKIP: [...], HEADER: [...]}.
+                Matching is case-insensitive; texts passed to scan() must be casefolded.
+        """
+        categories: Dict[str, set] = {}
+        for category, phrases in phrase_sets.items():
+            for phrase in phrases:
+                phrase = phrase.casefold()
+                if phrase:
+                    categories.setdefault(phrase, set()).add(category)
+
+        self.phrases = sorted(categories, key=len, reverse=True)
+        self._categories: Dict[str, FrozenSet[str]] = {
+            phrase: frozenset().union(*(categories[p] for p in categories if phrase.startswith(p)))
+            for phrase in self.phrases
+        }
+        # Stable description of the rules, for cache keys
+        self.signature = '\x1f'.join(f"{phrase}:{','.join(sorted(categories[phrase]))}"
+                                      for phrase in sorted(categories))
+        self._pattern: Optional[re.Pattern] = None
+        if self.phrases:
+            alternation = '|'.join(re.escape(phrase) for phrase in self.phrases)
+            self._pattern = re.compile(f'(?=({alternation}))')
+        self._key_cells: Dict[str, bool] = {}
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Categories of all phrases occurring in the casefolded text"""
+        if self._pattern is None or not text:
+            return _NO_HITS
+        hits = _NO_HITS
+        for match in self._pattern.finditer(text):
+            hits = hits | self._categories[match.group(1)]
+        return hits
+
+    def is_key_cell(self, text: str) -> bool:
+        """A cell can serve as a key unless it holds a skip phrase and no valid header"""
+        verdict = self._key_cells.get(text)
+        if verdict is None:
+            hits = self.scan(text)
+            verdict = SKIP not in hits or HEADER in hits
+            if len(self._key_cells) >= _KEY_CELL_CACHE_SIZE:
+                self._key_cells.clear()
+            self._key_cells[text] = verdict
+        return verdict
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import EXTRACTOR_VERSION
+from app.core.table_readers import TableRow
+
+# Trailing revision markers stripped from filenames: "... v2", "..._rev3", "... (1)"
+_REVISION_SUFFIX_RE = re.compile(r'(?:[\s_-]*(?:v|rev|revision)[\s_-]*\d+|\s*\(\d+\))+$', re.IGNORECASE)
+
+# (strategy name, key before duplicate suffixing, value)
+RowResult = Tuple[str, str, str]
+
+
+def revision_key_from_filename(path: str) -> str:
+    """Derive a series key from a filename, ignoring revision suffixes"""
+    stem = os.path.splitext(os.path.basename(str(path)))[0]
+    return ' '.join(_REVISION_SUFFIX_RE.sub('', stem).split()).casefold()
+
+
+def row_hash(row: TableRow) -> str:
+    """Content hash of a row's normalized cells"""
+    payload = row.source + '\x1e' + '\x1f'.join(row.cells)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class Revision:
+    """Row results and output fields of the previous revision of one document series"""
+
+    def __init__(self, key: str, rows: Dict[str, RowResult] = None, fields: Dict = None, schema: str = None):
+        self.key = key
+        self.rows = rows or {}
+        self.fields = fields
+        # Signature of the field schema the stored fields were produced with
+        self.schema = schema
+        self.new_rows: Dict[str, RowResult] = {}
+        self.reused = 0
+
+    @property
+    def is_first(self) -> bool:
+        return self.fields is None
+
+    def lookup(self, digest: str) -> Optional[RowResult]:
+        """Return the stored result for an unchanged row and keep it for the next revision"""
+        result = self.rows.get(digest)
+        if result is not None:
+            self.new_rows[digest] = result
+            self.reused += 1
+        return result
+
+    def record(self, digest: str, result: RowResult):
+        self.new_rows[digest] = result
+
+    def changed_fields(self, fields: Dict, ignore=()) -> List[str]:
+        """Fields added, removed or modified compared with the previous revision"""
+        if self.fields is None:
+            return []
+        changed = [k for k, v in fields.items() if k not in ignore and self.fields.get(k) != v]
+        changed += [k for k in self.fields if k not in ignore and k not in fields]
+        return changed
+
+
+class RevisionStore:
+    """Per-series record of row hashes and their extraction results.
+
+    One JSON file per series is kept under `directory`, holding the row results and the
+    extracted fields of the latest revision only.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def load(self, key: str) -> Revision:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return Revision(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable revision record {path}: {e}")
+            return Revision(key)
+        if state.get('version') != EXTRACTOR_VERSION:
+            # Results from an older extractor cannot be reused
+            return Revision(key)
+        rows = {digest: tuple(result) for digest, result in state.get('rows', {}).items()}
+        return Revision(key, rows, state.get('fields'), state.get('schema'))
+
+    def save(self, revision: Revision, fields: Dict, schema: str = None):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(revision.key)
+        state = {
+            'version': EXTRACTOR_VERSION,
+            'key': revision.key,
+            'rows': revision.new_rows,
+            'fields': fields,
+            'schema': schema,
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, f"{digest}.json")
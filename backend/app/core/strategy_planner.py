@@ -0,0 +1,103 @@
+from collections import Counter
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from app.core.coupon_schedule import CouponRecord, is_coupon_row
+from app.core.extraction_strategies import ExtractionStrategy
+from app.core.phrase_matcher import PhraseMatcher
+from app.core.table_readers import TableRow
+
+# (key, value, extraction_method) as returned by the ExtractionStrategy functions
+StrategyResult = Tuple[str, str, str]
+
+
+class StrategyRule(NamedTuple):
+    name: str
+    applies: Callable[[TableRow], bool]
+    handler: Callable[[TableRow, Dict], StrategyResult]
+    # False for strategies with side outputs (coupon records), which must re-run on every
+    # revision instead of reusing a stored (key, value) result
+    reusable: bool = True
+
+
+class StrategyPlanner:
+    """Pick the one extraction strategy that fits a row's shape.
+
+    Rules are checked in order and the first whose `applies(row)` is true handles the
+    row, so each row runs a single strategy. Coupon and cash-flow rows go to Strategy 3,
+    other rows follow the old Strategy 1 -> 2 order; more rules can be added with
+    `register()`. `hits` counts
+    rows dispatched per strategy for the current document, `total_hits` over all
+    documents.
+    """
+
+    def __init__(self, matcher: PhraseMatcher):
+        self.matcher = matcher
+        self.rules: List[StrategyRule] = [
+            StrategyRule("Strategy 3", is_coupon_row,
+                         lambda row, data_dict: ExtractionStrategy.apply_strategy3(row, self.coupon_records),
+                         reusable=False),
+            StrategyRule("Strategy 1", self._has_key_value_pair,
+                         lambda row, data_dict: ExtractionStrategy.apply_strategy1(row, matcher)),
+            StrategyRule("Strategy 2", self._has_single_value,
+                         lambda row, data_dict: ExtractionStrategy.apply_strategy2(row, matcher)),
+        ]
+        self.coupon_records: Optional[List[CouponRecord]] = None
+        self.hits: Counter = Counter()
+        self.total_hits: Counter = Counter()
+
+    def register(self, name: str, applies: Callable[[TableRow], bool],
+                 handler: Callable[[TableRow, Dict], StrategyResult], before: Optional[str] = None,
+                 reusable: bool = True):
+        """
+        Add a strategy to the dispatch table
+        Args:
+            name (str): Strategy name recorded in the debug log
+            applies (callable): Row predicate selecting this strategy
+            handler (callable): (row, data_dict) -> (key, value, extraction_method)
+            before (str): Name of an existing rule to insert in front of; appended if None
+            reusable (bool): Whether a revision may reuse the stored result of an unchanged row
+        """
+        rule = StrategyRule(name, applies, handler, reusable)
+        if before is None:
+            self.rules.append(rule)
+            return
+        names = [r.name for r in self.rules]
+        if before not in names:
+            raise ValueError(f"Unknown strategy '{before}'. Available: {', '.join(names)}")
+        self.rules.insert(names.index(before), rule)
+
+    def start_document(self, coupon_records: Optional[List[CouponRecord]] = None):
+        """Reset per-document counts; Strategy 3 appends to `coupon_records`"""
+        self.coupon_records = coupon_records
+        self.hits.clear()
+
+    def plan(self, row: TableRow) -> Optional[StrategyRule]:
+        for rule in self.rules:
+            if rule.applies(row):
+                return rule
+        return None
+
+    def apply(self, row: TableRow, data_dict: Dict) -> Tuple[Optional[StrategyRule], str, str, str]:
+        """
+        Run the planned strategy for a row
+        Returns:
+            tuple: (rule or None, key, value, extraction_method)
+        """
+        rule = self.plan(row)
+        if rule is None:
+            return None, "", "", ""
+        self.hits[rule.name] += 1
+        self.total_hits[rule.name] += 1
+        return (rule,) + tuple(rule.handler(row, data_dict))
+
+    def _has_key_value_pair(self, row: TableRow) -> bool:
+        # A usable key in any column that has a column to its right
+        is_key_cell = self.matcher.is_key_cell
+        return any(row.non_empty[i] and is_key_cell(row.folded[i]) for i in range(row.num_cols - 1))
+
+    def _has_single_value(self, row: TableRow) -> bool:
+        # Reached only when no key/value pair exists, so only the last cell can qualify
+        if not row.num_cols:
+            return False
+        last = row.num_cols - 1
+        return row.non_empty[last] and len(row.cells[last]) > 3 and self.matcher.is_key_cell(row.folded[last])
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import re
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from app.core.config import TERM_TABLE_HEADERS, TERM_TABLE_LABELS
+from app.core.table_readers import TableRow
+from app.processors.field_index import normalize_field_key
+
+TERMS = 'terms'
+SKIP = 'skip'
+
+
+_DIGITS_RE = re.compile(r'\d+')
+
+
+def table_fingerprint(rows: Sequence[TableRow]) -> str:
+    """
+    Hash of a table's layout: column count and spans of its leading rows, plus their
+    labels (first cell, normalized, without digits). Value cells and single-cell title
+    rows carry per-issue text such as the series or issuer, so they are left out and
+    the same template fingerprints the same across documents.
+    """
+    parts = []
+    for row in rows:
+        shape = ','.join(str(span.col_span) for span in row.spans)
+        label = _DIGITS_RE.sub('', normalize_field_key(row.cells[0])) if row.num_cols > 1 else ''
+        parts.append(f"{row.num_cols}|{shape}|{label}")
+    return hashlib.sha1('\x1e'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+
+class TableClassifier:
+    """Decide from the first few rows whether a table holds terms of issue.
+
+    Verdicts are stored per issuer template as {fingerprint: 'terms' | 'skip'} and can be
+    persisted to a JSON file, so a table seen before is classified from its first
+    `probe_rows` rows and skipped without reading any further cells. Unless a template name is given, the
+    template is identified by the fingerprint of the first table in the document.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, template: Optional[str] = None,
+                 probe_rows: int = 3, max_columns: int = 3):
+        """
+        Args:
+            cache_path (str): JSON file holding the fingerprint cache (in memory only if None)
+            template (str): Fixed issuer template name; derived per document if None
+            probe_rows (int): Leading rows fingerprinted, and inspected when the fingerprint
+                has not been seen before
+            max_columns (int): Widest table still treated as a terms table without a
+                "terms of issue" style header
+        """
+        self.cache_path = cache_path
+        self.template = template
+        self.probe_rows = probe_rows
+        self.max_columns = max_columns
+        self.cache: Dict[str, Dict[str, str]] = self._load()
+        self._document_template = template
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def start_document(self):
+        """Reset the per-document template before a new document is processed"""
+        self._document_template = self.template
+
+    def classify(self, rows: Iterator[TableRow]) -> Tuple[bool, Iterable[TableRow], bool]:
+        """
+        Classify a table from its leading rows.
+        Returns:
+            tuple: (is_terms_table, rows to process, verdict came from the cache)
+        """
+        probe = list(islice(rows, self.probe_rows))
+        if not probe:
+            return False, (), False
+
+        fingerprint = table_fingerprint(probe)
+        if self._document_template is None:
+            self._document_template = fingerprint
+        verdicts = self.cache.setdefault(self._document_template, {})
+
+        cached = verdicts.get(fingerprint)
+        if cached is not None:
+            self.hits += 1
+            # A skipped table's remaining rows are never pulled from the reader
+            return cached == TERMS, chain(probe, rows) if cached == TERMS else (), True
+
+        self.misses += 1
+        is_terms = self._looks_like_terms(probe)
+        verdicts[fingerprint] = TERMS if is_terms else SKIP
+        self._dirty = True
+        return is_terms, chain(probe, rows), False
+
+    def _looks_like_terms(self, probe) -> bool:
+        for row in probe:
+            if any(header in cell for cell in row.folded for header in TERM_TABLE_HEADERS):
+                return True
+
+        # Schedules and distribution lists are wider than key/value terms tables
+        if max(row.num_cols for row in probe) > self.max_columns:
+            return False
+
+        for row in probe:
+            label = next((cell for cell in row.folded if cell), '')
+            if any(known in label for known in TERM_TABLE_LABELS):
+                return True
+        return False
+
+    def save(self):
+        """Persist the fingerprint cache if it changed"""
+        if not (self.cache_path and self._dirty):
+            return
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'templates': self.cache}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                return json.load(f).get('templates', {})
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable table fingerprint cache {self.cache_path}: {e}")
+            return {}
@@ -0,0 +1,224 @@
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from app.processors.field_index import FieldKeyIndex
+from app.processors.field_schema import FieldPlan, FieldSpec, default_field_schema
+from app.utils.date_utils import parse_date
+from app.utils.indian_format import (
+    format_crores_batch,
+    format_indian_number_batch,
+    paise_product,
+    whole_rupees_batch,
+)
+from app.utils.number_tokens import GROUPED_NUMBER_RE, NUMBER_TOKEN_RE
+
+# A field's source column (a DataFrame of the depends_on columns for computed fields)
+# -> one column per spec output. Rows missing from the result get nothing written,
+# like a per-document extractor returning None.
+BatchExtractor = Callable[[Union[pd.Series, pd.DataFrame], FieldSpec], pd.DataFrame]
+
+_STRICT_GROUPED_RE = f'^({GROUPED_NUMBER_RE.pattern})'
+
+
+def _outputs(spec: FieldSpec, *columns: pd.Series) -> pd.DataFrame:
+    return pd.DataFrame(dict(zip(spec.outputs, columns)))
+
+
+def _indian_amounts(numbers: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Whole rupees and their Indian grouping for each number string; NaN stays NaN"""
+    present = numbers.dropna()
+    rupees = whole_rupees_batch(present.to_numpy(dtype=str))
+    whole = pd.Series(np.asarray(rupees, dtype=str).astype(object), index=present.index, dtype=object)
+    grouped = pd.Series(format_indian_number_batch(rupees), index=present.index, dtype=object)
+    return whole.reindex(numbers.index), grouped.reindex(numbers.index)
+
+
+def _first_tokens(values: pd.Series) -> pd.DataFrame:
+    """Groups of the first numeric token of each value (NaN where there is none)"""
+    return values.str.extract(NUMBER_TOKEN_RE)
+
+
+def _batch_series(values: pd.Series, spec: FieldSpec) -> pd.DataFrame:
+    last = values.str.split().str[-1]
+    series = pd.Series('', index=values.index)
+    is_number = last.str.isdigit().fillna(False).astype(bool)
+    series[is_number] = 'Series ' + last[is_number]
+    has_series = last.str.lower().str.contains('series', regex=False).fillna(False).astype(bool)
+    series[has_series] = last[has_series]
+    return _outputs(spec, series)
+
+
+def _batch_number(values: pd.Series, spec: FieldSpec) -> pd.DataFrame:
+    return _outputs(spec, _first_tokens(values)['integer'].fillna(''))
+
+
+def _batch_issue_size(values: pd.Series, spec: FieldSpec) -> pd.DataFrame:
+    # (currency, number, integer) groups of every token
+    tokens = values.str.findall(NUMBER_TOKEN_RE)
+    first = tokens.str[0].str[1].str.replace(',', '', regex=False)
+    fourth = tokens.str[3].str[1].str.replace(',', '', regex=False)
+    total = _indian_amounts(fourth)[1]
+    return _outputs(spec, first.fillna(''), total.fillna(''))
+
+
+def _batch_indian_amount(values: pd.Series, spec: FieldSpec) -> pd.DataFrame:
+    tokens = _first_tokens(values)
+    if spec.params.get('integer'):
+        numbers, formatted = _indian_amounts(tokens['number'].str.replace(',', '', regex=False))
+    else:
+        numbers = tokens['number'].str.extract(_STRICT_GROUPED_RE)[0].str.replace(',', '', regex=False)
+        formatted = _indian_amounts(numbers)[1]
+    return _outputs(spec, numbers.fillna(''), formatted.fillna(''))
+
+
+def _formatted_dates(values: pd.Series, spec: FieldSpec) -> pd.Series:
+    """DDMMYYYY for each parseable date; every distinct text is parsed once"""
+    formatted = {}
+    for value in values.unique():
+        parsed = parse_date(value, spec.date_formats)
+        if parsed:
+            formatted[value] = parsed.strftime("%d%m%Y")
+    return values.map(formatted).dropna()
+
+
+def _batch_date(values: pd.Series, spec: FieldSpec) -> pd.DataFrame:
+    return _outputs(spec, _formatted_dates(values, spec))
+
+
+def _batch_digits(values: pd.Series, spec: FieldSpec) -> pd.DataFrame:
+    formatted = _formatted_dates(values, spec)
+    return _outputs(spec, *(formatted.str[position] for position in range(8)), formatted)
+
+
+def _batch_crores(values: pd.DataFrame, spec: FieldSpec) -> pd.DataFrame:
+    codes, combinations = pd.factorize(pd.MultiIndex.from_frame(values))
+    paise, valid = [], []
+    for factors in combinations:
+        try:
+            paise.append(paise_product(*factors))
+            valid.append(True)
+        except (ValueError, TypeError, ArithmeticError):
+            paise.append(0)
+            valid.append(False)
+    amounts = np.where(valid, format_crores_batch(paise), 'Rs 0 crores').astype(object)
+    invalid = ~np.asarray(valid, dtype=bool)[codes]
+    if invalid.any():
+        print(f"⚠️ Error calculating total value for {int(invalid.sum())} rows")
+    return _outputs(spec, pd.Series(amounts[codes], index=values.index))
+
+
+# Column-wise versions of the field schema extractor types; extend with register_batch_extractor()
+BATCH_EXTRACTORS: Dict[str, BatchExtractor] = {
+    'series': _batch_series,
+    'number': _batch_number,
+    'issue_size': _batch_issue_size,
+    'indian_amount': _batch_indian_amount,
+    'date': _batch_date,
+    'digits': _batch_digits,
+    'crores': _batch_crores,
+}
+
+
+def register_batch_extractor(name: str, func: BatchExtractor):
+    """Add a column-wise implementation for an extractor type"""
+    BATCH_EXTRACTORS[name] = func
+
+
+def _batch_rowwise(values: Union[pd.Series, pd.DataFrame], spec: FieldSpec) -> pd.DataFrame:
+    """Fallback for extractor types without a column-wise version: run the scalar one per distinct value"""
+    if isinstance(values, pd.DataFrame):
+        sources = pd.Series(list(values.itertuples(index=False, name=None)), index=values.index)
+    else:
+        sources = values
+    results = {}
+    for source in sources.unique():
+        extracted = spec.extractor.func(source, spec)
+        if extracted is not None:
+            results[source] = tuple(extracted)
+    rows = sources.map(results).dropna()
+    return pd.DataFrame(rows.tolist(), index=rows.index, columns=list(spec.outputs))
+
+
+class BatchFieldProcessor:
+    # Column-wise counterpart of FieldProcessor for backfills: one row per document,
+    # one column per extracted label, same derived columns as the per-document path.
+
+    @staticmethod
+    def process_frame(frame: pd.DataFrame, plan: FieldPlan = None, processing_date: str = None,
+                      debug: bool = True) -> pd.DataFrame:
+        """
+        Add every derived column for a DataFrame of raw extractions
+        Args:
+            frame (DataFrame): One row per document, columns named by extracted label;
+                NaN where a document has no such label
+            plan (FieldPlan): Compiled field schema; the bundled schema if None
+            processing_date (str): Date in YYYY-MM-DD format, applied to every row
+        Returns:
+            DataFrame: A copy of frame with the derived columns added
+        """
+        plan = plan or default_field_schema().plan()
+        result = frame.reset_index(drop=True)
+
+        date_columns = plan.input_columns('processing_date', processing_date)
+        if date_columns:
+            result = result.assign(**date_columns)
+
+        for spec in plan.steps:
+            if spec.field:
+                source = BatchFieldProcessor._field_values(result, plan.index, spec.field)
+            elif all(column in result for column in spec.depends_on):
+                source = result[list(spec.depends_on)].dropna()
+            else:
+                continue
+            if source is None or source.empty:
+                continue
+
+            values = BatchFieldProcessor._extract(spec, source)
+            result = BatchFieldProcessor._merge(result, values)
+            if debug:
+                print(f"📎 {spec.name}: {len(values)} of {len(result)} rows")
+
+        result.index = frame.index
+        if debug:
+            print(f"✅ Processed fields for {len(result)} documents")
+        return result
+
+    @staticmethod
+    def _extract(spec: FieldSpec, source: Union[pd.Series, pd.DataFrame]) -> pd.DataFrame:
+        """Run a step's extractor; a field's text is extracted once per distinct value"""
+        extractor = BATCH_EXTRACTORS.get(spec.type_name, _batch_rowwise)
+        if isinstance(source, pd.DataFrame):
+            return extractor(source, spec)
+        codes, uniques = pd.factorize(source)
+        extracted = extractor(pd.Series(uniques, dtype=source.dtype), spec)
+        keep = np.isin(codes, extracted.index)
+        values = extracted.reindex(codes[keep])
+        values.index = source.index[keep]
+        return values
+
+    @staticmethod
+    def _field_values(frame: pd.DataFrame, index: FieldKeyIndex, field: str) -> Optional[pd.Series]:
+        """
+        A field's value per row. As in FieldKeyIndex.resolve, a column named exactly like
+        the field wins, then the other matching labels in column order.
+        """
+        columns: List = [column for column in frame.columns if index.canonical(column) == field]
+        if not columns:
+            return None
+        columns.sort(key=lambda column: column != field)
+        values = frame[columns[0]]
+        for column in columns[1:]:
+            values = values.combine_first(frame[column])
+        return values.dropna().astype(str)
+
+    @staticmethod
+    def _merge(frame: pd.DataFrame, values: pd.DataFrame) -> pd.DataFrame:
+        """Write extracted columns: existing columns are updated in place, new ones appended"""
+        new_columns = [column for column in values.columns if column not in frame.columns]
+        for column in values.columns.difference(new_columns, sort=False):
+            frame[column] = values[column].combine_first(frame[column])
+        if new_columns:
+            frame = pd.concat([frame, values[new_columns].reindex(frame.index)], axis=1)
+        return frame
@@ -0,0 +1,50 @@
+import re
+from typing import Dict, Iterable, Mapping, Optional
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def normalize_field_key(key: str) -> str:
+    """Casefold a label and drop punctuation and whitespace: "Tenor (in days)" -> "tenorindays" """
+    return _NON_WORD_RE.sub('', str(key).casefold())
+
+
+class FieldKeyIndex:
+    """Map extracted labels to canonical field names regardless of spelling.
+
+    Built once from the canonical names and an alias table; every lookup is a single
+    dict hit on the normalized label.
+    """
+
+    def __init__(self, canonical_fields: Iterable[str], aliases: Mapping[str, Iterable[str]] = None):
+        """
+        Args:
+            canonical_fields (iterable): Field names the processors and templates expect
+            aliases (dict): Canonical field -> alternative labels issuers use for it
+                (the 'aliases' of the field schema entries)
+        """
+        self._index: Dict[str, str] = {}
+        for field in canonical_fields:
+            self._index.setdefault(normalize_field_key(field), field)
+        for field, labels in (aliases or {}).items():
+            self._index.setdefault(normalize_field_key(field), field)
+            for label in labels:
+                self._index.setdefault(normalize_field_key(label), field)
+
+    def canonical(self, key: str) -> Optional[str]:
+        """Canonical field for an extracted label, or None if it is not a known field"""
+        return self._index.get(normalize_field_key(key))
+
+    def resolve(self, data_dict: Mapping) -> Dict[str, str]:
+        """
+        Locate known fields in extracted data
+        Returns:
+            dict: Canonical field -> key actually used in data_dict. A key spelled exactly
+                like the canonical name wins, otherwise the first matching label does.
+        """
+        found: Dict[str, str] = {}
+        for key in data_dict:
+            field = self.canonical(key)
+            if field is not None and (field not in found or key == field):
+                found[field] = key
+        return found
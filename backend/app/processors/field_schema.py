@@ -0,0 +1,257 @@
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from app.processors.field_index import FieldKeyIndex
+from app.utils.date_utils import DATE_FORMATS, PROCESSING_DATE_FORMAT, parse_date
+from app.utils.number_utils import (
+    calculate_crores,
+    extract_face_value_number,
+    extract_issue_price_number,
+    extract_tenor_days_number,
+)
+from app.utils.text_utils import extract_issue_size_number, extract_series_number
+
+DEFAULT_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'field_schema.json')
+
+
+class Extractor(NamedTuple):
+    # Number of output columns the extractor produces, None for any
+    arity: Optional[int]
+    # (source, spec) -> tuple of output values, or None to write nothing
+    func: Callable[[object, 'FieldSpec'], Optional[Tuple]]
+
+
+# Date extractors parse through the shared DateEngine, which learns each field's format
+
+def _extract_date(value, spec):
+    parsed = parse_date(value, spec.date_formats)
+    return (parsed.strftime("%d%m%Y"),) if parsed else None
+
+
+def _extract_digits(value, spec):
+    parsed = parse_date(value, spec.date_formats)
+    if not parsed:
+        return None
+    formatted = parsed.strftime("%d%m%Y")
+    return tuple(formatted) + (formatted,)
+
+
+def _extract_processing_date(value, spec):
+    parsed = parse_date(value, (PROCESSING_DATE_FORMAT,))
+    if not parsed:
+        print(f"⚠️ Error processing date: '{value}' does not match format '{PROCESSING_DATE_FORMAT}'")
+        return None
+    formatted = parsed.strftime("%d%m%Y")
+    return (value, formatted, parsed.strftime("%d %B, %Y")) + tuple(formatted)
+
+
+# Extractor types available to schema entries; extend with register_extractor()
+EXTRACTORS: Dict[str, Extractor] = {
+    'series': Extractor(1, lambda value, spec: (extract_series_number(value),)),
+    'number': Extractor(1, lambda value, spec: (extract_tenor_days_number(value),)),
+    'issue_size': Extractor(2, lambda value, spec: extract_issue_size_number(value)),
+    'indian_amount': Extractor(2, lambda value, spec: (
+        extract_face_value_number(value) if spec.params.get('integer') else extract_issue_price_number(value))),
+    'date': Extractor(1, _extract_date),
+    'digits': Extractor(9, _extract_digits),
+    'crores': Extractor(1, lambda values, spec: (calculate_crores(*values),)),
+    'processing_date': Extractor(11, _extract_processing_date),
+}
+
+
+def register_extractor(name: str, func: Callable, arity: Optional[int] = None):
+    """Make a new extractor type available to field schemas"""
+    EXTRACTORS[name] = Extractor(arity, func)
+
+
+class FieldSpec(NamedTuple):
+    name: str
+    field: Optional[str]            # Canonical source label, for extracted fields
+    input: Optional[str]            # Run input name (e.g. processing_date), for input fields
+    depends_on: Tuple[str, ...]     # Columns a computed field reads
+    extractor: Optional[Extractor]
+    outputs: Tuple[str, ...]
+    date_formats: Tuple[str, ...]
+    params: Dict
+    type_name: Optional[str] = None  # Extractor type as named in the schema
+
+
+class FieldPlan:
+    """Compiled field schema: label index plus the ordered list of field steps to run"""
+
+    def __init__(self, specs: List[FieldSpec], index: FieldKeyIndex, source: str = None, signature: str = ''):
+        self.specs = specs
+        self.index = index
+        self.source = source
+        # Content hash of the schema, for cache keys and stored revisions
+        self.signature = signature
+        self._inputs = {spec.input: spec for spec in specs if spec.input}
+        self._steps = [spec for spec in specs if spec.extractor and not spec.input]
+
+    @property
+    def steps(self) -> List[FieldSpec]:
+        """Extracted and computed field steps in run order"""
+        return self._steps
+
+    def run(self, data_dict: Dict, debug: bool = True, previous: Dict = None) -> Dict:
+        """
+        Add every derived column for the extracted fields
+        Args:
+            previous (dict): Output of the previous revision of the same document; fields
+                whose source value is unchanged copy its columns instead of re-extracting
+        """
+        fields = self.index.resolve(data_dict)
+        previous_fields = self.index.resolve(previous) if previous else {}
+
+        for spec in self._steps:
+            if spec.field:
+                key = fields.get(spec.field)
+                if key is None:
+                    continue
+                source = data_dict[key]
+                previous_key = previous_fields.get(spec.field)
+                if previous_key is not None and previous[previous_key] == source:
+                    for output in spec.outputs:
+                        if output in previous:
+                            data_dict[output] = previous[output]
+                    continue
+            else:
+                if not all(column in data_dict for column in spec.depends_on):
+                    continue
+                source = tuple(data_dict[column] for column in spec.depends_on)
+
+            values = spec.extractor.func(source, spec)
+            if values is None:
+                continue
+            data_dict.update(zip(spec.outputs, values))
+            if debug:
+                print(f"📎 {spec.name}: {', '.join(f'{k}={v}' for k, v in zip(spec.outputs, values))}")
+        return data_dict
+
+    def input_columns(self, name: str, value) -> Optional[Dict]:
+        """Columns derived from a run input such as the processing date"""
+        spec = self._inputs.get(name)
+        if spec is None or value is None:
+            return None
+        values = spec.extractor.func(value, spec)
+        return dict(zip(spec.outputs, values)) if values is not None else None
+
+
+def compile_schema(schema: Dict, source: str = None) -> FieldPlan:
+    """
+    Validate a schema document and compile it into a FieldPlan
+    Raises:
+        ValueError: For unknown extractor types, wrong output counts or dependency cycles
+    """
+    default_formats = tuple(schema.get('date_formats') or DATE_FORMATS)
+    labels = {}
+    specs = []
+    for entry in schema.get('fields', []):
+        entry = dict(entry)
+        field = entry.pop('field', None)
+        input_name = entry.pop('input', None)
+        name = entry.pop('name', None) or field or input_name
+        aliases = entry.pop('aliases', ())
+        type_name = entry.pop('type', None)
+        outputs = tuple(entry.pop('outputs', ()))
+        depends_on = tuple(entry.pop('depends_on', ()))
+        date_formats = tuple(entry.pop('date_formats', default_formats))
+        if not name:
+            raise ValueError(f"Schema entry needs a 'field', 'input' or 'name': {entry}")
+        if field:
+            labels[field] = aliases
+
+        extractor = None
+        if type_name is not None:
+            if type_name not in EXTRACTORS:
+                raise ValueError(f"Unknown extractor type '{type_name}' for {name}. "
+                                 f"Available: {', '.join(sorted(EXTRACTORS))}")
+            extractor = EXTRACTORS[type_name]
+            if extractor.arity is not None and len(outputs) != extractor.arity:
+                raise ValueError(f"{name}: type '{type_name}' produces {extractor.arity} columns, "
+                                 f"{len(outputs)} outputs given")
+            if not (field or input_name or depends_on):
+                raise ValueError(f"{name}: needs a 'field', 'input' or 'depends_on' to read from")
+        specs.append(FieldSpec(name, field, input_name, depends_on, extractor, outputs, date_formats, entry,
+                               type_name))
+
+    signature = hashlib.sha1(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    return FieldPlan(_order_by_dependencies(specs), FieldKeyIndex(labels, labels), source, signature)
+
+
+def _order_by_dependencies(specs: List[FieldSpec]) -> List[FieldSpec]:
+    """Stable topological order: a step runs after the steps producing its dependencies"""
+    producers = {}
+    for position, spec in enumerate(specs):
+        for output in spec.outputs:
+            producers.setdefault(output, position)
+
+    ordered, state = [], {}
+
+    def visit(position):
+        if state.get(position) == 'done':
+            return
+        if state.get(position) == 'visiting':
+            raise ValueError(f"Dependency cycle at schema entry '{specs[position].name}'")
+        state[position] = 'visiting'
+        for column in specs[position].depends_on:
+            if column in producers and producers[column] != position:
+                visit(producers[column])
+        state[position] = 'done'
+        ordered.append(specs[position])
+
+    for position in range(len(specs)):
+        visit(position)
+    return ordered
+
+
+class FieldSchemaLoader:
+    """Compiled field schema that follows changes to its JSON file.
+
+    `plan()` stats the file and recompiles only when its modification time or size
+    changed, so long-running sessions pick up edits without a restart. A schema that
+    fails to load keeps the previous plan in use.
+    """
+
+    def __init__(self, path: str = DEFAULT_SCHEMA_PATH):
+        self.path = path
+        self._plan: Optional[FieldPlan] = None
+        self._signature = None
+
+    def plan(self) -> FieldPlan:
+        try:
+            stat = os.stat(self.path)
+        except OSError as e:
+            if self._plan is None:
+                raise
+            print(f"⚠️ Field schema {self.path} unavailable, keeping loaded schema: {e}")
+            return self._plan
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self._signature:
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    plan = compile_schema(json.load(f), self.path)
+            except (OSError, ValueError) as e:
+                if self._plan is None:
+                    raise
+                print(f"⚠️ Ignoring invalid field schema {self.path}, keeping loaded schema: {e}")
+            else:
+                if self._plan is not None:
+                    print(f"🔄 Reloaded field schema {self.path}")
+                self._plan = plan
+            self._signature = signature
+        return self._plan
+
+
+_default_loader: Optional[FieldSchemaLoader] = None
+
+
+def default_field_schema() -> FieldSchemaLoader:
+    """Shared loader for the bundled field_schema.json"""
+    global _default_loader
+    if _default_loader is None:
+        _default_loader = FieldSchemaLoader()
+    return _default_loader
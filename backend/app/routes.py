@@ -1,10 +1,15 @@
-from flask import Blueprint, request, send_file, after_this_request
+from flask import Blueprint, request, send_file
 from werkzeug.utils import secure_filename
-import os
-import shutil
+import io
+from app.core.config import RESULT_CACHE_WEB_DIR
 from app.core.document_processor_new import DocumentProcessor
+from app.core.output_sinks import OUTPUT_SINKS, get_output_sink
+from app.core.result_cache import ResultCache
 
-ob = DocumentProcessor(debug=True)
+# Re-uploads of the same document are answered from the cache without parsing again.
+# Requests run on several threads, so each gets its own DocumentProcessor (it holds the
+# state of the document being converted) and only the cache is shared.
+result_cache = ResultCache(directory=RESULT_CACHE_WEB_DIR)
 
 routes = Blueprint('routes', __name__)
 
@@ -15,43 +20,50 @@ def upload_file():
 
     file = request.files['file']
     processing_date = request.form.get('date')
-    
+
     if not processing_date:
         return {'error': 'Processing date is required'}, 400
-    
+
+    # Output format: xlsx (default), csv, jsonl, or parquet when pyarrow is installed
+    try:
+        sink = get_output_sink(request.form.get('format', 'xlsx'))
+    except ValueError as e:
+        return {'error': str(e)}, 400
+
     if file.filename == '':
         return {'error': 'No selected file'}, 400
 
     if file and file.filename.endswith('.docx'):
         filename = secure_filename(file.filename)
-        tmp_dir = os.path.join(os.getcwd(), 'tmp')  # Use a 'tmp' folder in the current working directory
-        os.makedirs(tmp_dir, exist_ok=True)  # Ensure the directory exists
-        docx_path = os.path.join(tmp_dir, filename)
-        file.save(docx_path)
-
-        xlsx_filename = filename.rsplit('.', 1)[0] + '.xlsx'
-        xlsx_path = os.path.join(tmp_dir, xlsx_filename)
+        output_filename = filename.rsplit('.', 1)[0] + sink.extension
 
         try:
-            ob.convert_docx_to_xlsx(docx_path, xlsx_path,  processing_date=processing_date)
-
-            # Debug: Confirm cleanup registration
-            print(f"🧹 Registering cleanup for directory: {tmp_dir}")
-
-            # Schedule cleanup after the response is sent
-            @after_this_request
-            def cleanup(response):
-                print(f"🧹 Cleaning up directory: {tmp_dir}")
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-                return response
-
-            # Debug: Confirm file is being sent
-            print(f"📤 Sending file: {xlsx_path}")
-            return send_file(xlsx_path, as_attachment=True, max_age=0)
+            # Convert entirely in memory - nothing is written to disk
+            processor = DocumentProcessor(debug=True, result_cache=result_cache)
+            output_bytes = processor.convert_docx_bytes(file.read(), processing_date=processing_date,
+                                                        output_format=sink.name)
         except Exception as e:
-            # Cleanup in case of an error
             print(f"⚠️ Exception occurred: {e}")
-            shutil.rmtree(tmp_dir, ignore_errors=True)
             return {'error': str(e)}, 500
 
-    return {'error': 'Invalid file type. Only DOCX files are accepted.'}, 400
\ No newline at end of file
+        # Debug: Confirm file is being sent
+        print(f"📤 Sending file: {output_filename} ({len(output_bytes)} bytes)")
+        return send_file(
+            io.BytesIO(output_bytes),
+            mimetype=sink.mimetype,
+            as_attachment=True,
+            download_name=output_filename,
+            max_age=0
+        )
+
+    return {'error': 'Invalid file type. Only DOCX files are accepted.'}, 400
+
+
+@routes.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    return result_cache.stats()
+
+
+@routes.route('/formats', methods=['GET'])
+def output_formats():
+    return {'formats': list(OUTPUT_SINKS)}
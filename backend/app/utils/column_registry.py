@@ -0,0 +1,66 @@
+import json
+import os
+from typing import Dict, Iterable, List, Mapping, Optional
+
+
+class ColumnRegistry:
+    """Columns of a master workbook's Terms sheet, by name, in first-seen order.
+
+    A new name is given the next column index, so documents with extra or missing
+    fields are laid out by name: extra fields become new columns at the end and
+    missing ones stay blank. The registry is saved as JSON next to the workbook, so
+    appends can lay out rows without opening it.
+    """
+
+    def __init__(self, columns: Iterable[str] = (), rows: int = 0, path: str = None, workbook: list = None):
+        """
+        Args:
+            rows (int): Data rows in the workbook the registry describes
+            path (str): JSON file the registry is saved to
+            workbook (list): [mtime_ns, size] of the workbook it describes, to tell if it changed since
+        """
+        self.path = path
+        self.rows = rows
+        self.workbook = workbook
+        self.columns: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.add(columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def add(self, names: Iterable[str]) -> int:
+        """
+        Register column names not seen before
+        Returns:
+            int: Number of new columns
+        """
+        added = 0
+        for name in names:
+            if name not in self.index:
+                self.index[name] = len(self.columns)
+                self.columns.append(name)
+                added += 1
+        return added
+
+    def row(self, values: Mapping) -> list:
+        """Values laid out on the registered columns, blank where a column has no value"""
+        return [values.get(column, "") for column in self.columns]
+
+    def save(self):
+        if not self.path:
+            return
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump({'columns': self.columns, 'rows': self.rows, 'workbook': self.workbook}, f, ensure_ascii=False)
+        os.replace(temporary_path, self.path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['ColumnRegistry']:
+        """The registry saved at path, or None if there is none"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return cls(state.get('columns', ()), state.get('rows', 0), path, state.get('workbook'))
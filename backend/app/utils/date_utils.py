@@ -1,4 +1,91 @@
+import re
 from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+# Date spellings seen in term sheets, tried in order
+DATE_FORMATS = ("%B %d, %Y", "%B %d,%Y", "%d %B %Y", "%d/%m/%Y", "%Y-%m-%d")
+
+# Format of the processing date sent by the frontends
+PROCESSING_DATE_FORMAT = "%Y-%m-%d"
+
+# "1st", "22nd", "23rd", "4th" -> day number
+_ORDINAL_RE = re.compile(r'(?<=\d)(?:st|nd|rd|th)\b', re.IGNORECASE)
+_DIRECTIVE_RE = re.compile(r'%.')
+_TEXT_DIRECTIVES = ('%B', '%b', '%A', '%a', '%p')
+
+class DateEngine:
+    """
+    Parse-once date parser.
+
+    Each distinct (text, formats) pair is parsed at most once and kept in a bounded
+    cache, including failures. Formats are tried in the order given, skipping those
+    whose literal separators are missing from the text, so a value always parses the
+    same way. Ordinal suffixes ("1st", "23rd") are removed before parsing.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._cache: Dict[Tuple[str, Tuple[str, ...]], Optional[datetime]] = {}
+        self._requirements: Dict[str, Tuple[frozenset, bool]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, date_value: str, date_formats: Tuple[str, ...] = DATE_FORMATS) -> Optional[datetime]:
+        """
+        Parse a date written in any of the given formats
+        Returns:
+            datetime | None: The parsed date, or None if no format matches
+        """
+        if not date_value:
+            return None
+        date_formats = tuple(date_formats)
+        key = (date_value, date_formats)
+        if key in self._cache:
+            self.hits += 1
+            return self._cache[key]
+        self.misses += 1
+
+        text = _ORDINAL_RE.sub('', date_value)
+        parsed = None
+        for fmt in self._candidates(text, date_formats):
+            try:
+                parsed = datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+            break
+
+        if len(self._cache) >= self.max_entries:
+            self._cache.clear()
+        self._cache[key] = parsed
+        return parsed
+
+    def _candidates(self, text: str, date_formats: Tuple[str, ...]):
+        chars = set(text.lower())
+        has_alpha = any(c.isalpha() for c in text)
+        for fmt in date_formats:
+            literals, needs_alpha = self._format_requirements(fmt)
+            if literals <= chars and (has_alpha or not needs_alpha):
+                yield fmt
+
+    def _format_requirements(self, fmt: str) -> Tuple[frozenset, bool]:
+        """Separator characters a format needs in the text and whether it needs month/day names"""
+        requirements = self._requirements.get(fmt)
+        if requirements is None:
+            literals = frozenset(_DIRECTIVE_RE.sub('', fmt).lower()) - frozenset(' ')
+            requirements = (literals, any(d in fmt for d in _TEXT_DIRECTIVES))
+            self._requirements[fmt] = requirements
+        return requirements
+
+# Shared engine used by the field schema and processing-date handling
+DATE_ENGINE = DateEngine()
+
+def parse_date(date_value, date_formats=DATE_FORMATS):
+    """
+    Parse a date written in any of the given formats
+    Returns:
+        datetime | None: The parsed date, or None if no format matches
+    """
+    return DATE_ENGINE.parse(date_value, date_formats)
 
 def handle_processing_date(date_string):
     """
@@ -9,10 +96,9 @@ def handle_processing_date(date_string):
         dict: Dictionary containing formatted date components
     """
     
-    try:
-        # Parse the date string (expected format: YYYY-MM-DD)
-        parsed_date = datetime.strptime(date_string, "%Y-%m-%d")
-        
+    # Parse the date string (expected format: YYYY-MM-DD)
+    parsed_date = parse_date(date_string, (PROCESSING_DATE_FORMAT,))
+    if parsed_date:
         # Format into DDMMYYYY
         formatted_date = parsed_date.strftime("%d%m%Y")
 
@@ -34,7 +120,6 @@ def handle_processing_date(date_string):
         }
         
         return date_components
-    except ValueError as e:
-        print(f"⚠️ Error processing date: {e}")
-        return None
+    print(f"⚠️ Error processing date: '{date_string}' does not match format '{PROCESSING_DATE_FORMAT}'")
+    return None
     
\ No newline at end of file
@@ -0,0 +1,43 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+# One scan finds every number together with an optional currency marker in front of it.
+# The number part is deliberately loose (commas anywhere, trailing dot) so each helper
+# can narrow a token to the form it has always used.
+NUMBER_TOKEN_RE = re.compile(r'(?P<currency>(?:\b(?:Rs|INR)\.?|₹)\s*)?(?P<number>(?P<integer>\d+)[\d,]*(?:\.[\d,]*)?)')
+
+# Strict grouped form: 1,00,000 or 95,500.50 (commas and decimals followed by digits)
+GROUPED_NUMBER_RE = re.compile(r'\d+(?:,\d+)*(?:\.\d+)?')
+
+
+class NumberToken(NamedTuple):
+    start: int          # Offset of the first digit in the scanned text
+    end: int
+    integer: str        # Leading digit run: "1" for "1,00,000"
+    number: str         # Digits with every comma dropped: "100000" for "1,00,000/-"
+    grouped: str        # Strict comma-grouped form: "1,00,000"
+    currency: str       # Currency marker in front of the number ("Rs.", "INR", "₹") or ""
+
+
+@lru_cache(maxsize=4096)
+def tokenize_numbers(text: str) -> Tuple[NumberToken, ...]:
+    """
+    All numeric tokens in a text, in order, from a single precompiled scan.
+    Results are memoized, so extractors reading the same value share one scan.
+    """
+    if not text:
+        return ()
+    tokens = []
+    for match in NUMBER_TOKEN_RE.finditer(text):
+        start, end = match.span('number')
+        raw = match.group('number')
+        tokens.append(NumberToken(
+            start=start,
+            end=end,
+            integer=match.group('integer'),
+            number=raw.replace(',', ''),
+            grouped=GROUPED_NUMBER_RE.match(raw).group(0),
+            currency=(match.group('currency') or '').strip(),
+        ))
+    return tuple(tokens)
@@ -1,17 +1,14 @@
-from app.utils.text_utils import format_indian_number
+from app.utils.number_tokens import tokenize_numbers
+from app.utils.indian_format import crores_text, format_indian_number, whole_rupees
 
 def extract_tenor_days_number(tenor_text):
     """Extract number from Tenor in Days text"""
-    import re
-    
     if not tenor_text:
         return ""
     
-    # Find numbers in the text
-    numbers = re.findall(r'\d+', tenor_text)
-    
-    # Return first number found or empty string if none found
-    return numbers[0] if numbers else ""
+    # Return the first run of digits or empty string if none found
+    tokens = tokenize_numbers(tenor_text)
+    return tokens[0].integer if tokens else ""
 
 def extract_face_value_number(face_value):
     """
@@ -19,26 +16,21 @@ def extract_face_value_number(face_value):
     Returns tuple: (number_as_string, formatted_with_commas)
     Example: "Rs. 1,00,000/- (Rupees One Lakh Only)" -> ("100000", "1,00,000")
     """
-    import re
-    
     if not face_value:
         return ("", "")
     
-    # Remove commas from numbers
-    cleaned_text = face_value.replace(',', '')
+    # Find numbers including decimals, commas removed
+    tokens = tokenize_numbers(face_value)
     
-    # Find numbers including decimals
-    numbers = re.findall(r'\d+\.?\d*', cleaned_text)
-    
-    if numbers:
+    if tokens:
+        number_str = tokens[0].number
         try:
             # Convert to integer if possible
-            number_str = numbers[0]
-            number_int = int(float(number_str))
+            number_int = whole_rupees(number_str)
             formatted = format_indian_number(number_int)
             return (str(number_int), formatted)
         except (ValueError, TypeError):
-            return (numbers[0], numbers[0])
+            return (number_str, number_str)
     
     return ("", "")
 
@@ -47,24 +39,18 @@ def calculate_amount_raised(data_dict):
     Calculate total value by multiplying issue size and face value,
     converting from lakhs to crores
     """
-    try:
-        # Get values and convert to float
-        issue_size_num = float(data_dict.get('issue_size_num', 0))
-        face_value = float(data_dict.get('face_value_num', 0))
-        print(f"Calculating amount raised: issue_size_num={issue_size_num}, face_value={face_value}")
-        # Calculate total in lakhs
-        total_in_lakhs = issue_size_num * face_value
-        
-        # Convert to crores (1 crore = 100 lakhs)
-        total_in_crores = total_in_lakhs / 10000000
-        
-        # Format with comma separators and 2 decimal places
-        formatted_value = f"Rs {total_in_crores:,.2f} crores"
-        
-        return formatted_value
-    except (ValueError, TypeError) as e:
-        print(f"⚠️ Error calculating total value: {e}")
-        return "Rs 0 crores"
+    issue_size_num = data_dict.get('issue_size_num', 0)
+    face_value = data_dict.get('face_value_num', 0)
+    print(f"Calculating amount raised: issue_size_num={issue_size_num}, face_value={face_value}")
+    return calculate_crores(issue_size_num, face_value)
+
+def calculate_crores(*factors):
+    """
+    Multiply rupee amounts and express the product in crores
+    Example: ("75", "100000") -> "Rs 0.75 crores"
+    """
+    # Exact paise arithmetic, so large issue sizes do not drift through floats
+    return crores_text(*factors)
 
 def extract_discount_value_number(discount_text):
     """
@@ -72,25 +58,22 @@ def extract_discount_value_number(discount_text):
     Returns a tuple: (number_as_string, formatted_with_commas)
     Example: "Rs. 4,500/- (Rupees Four Thousand Five Hundred Only)" -> ("4500", "4,500")
     """
-    import re
-
     if not discount_text:
         return ("", "")
 
-    # First find any number pattern that may include commas
-    number_pattern = r'(?:Rs\.?\s*)?(\d+(?:,\d+)*(?:\.\d+)?)'
-    matches = re.search(number_pattern, discount_text)
+    # First number, which may include comma grouping
+    tokens = tokenize_numbers(discount_text)
 
-    if matches:
+    if tokens:
         # Remove commas from the matched number
-        number_str = matches.group(1).replace(',', '')
+        number_str = tokens[0].grouped.replace(',', '')
         try:
             # Try to convert to int if possible, else float
             if '.' in number_str:
                 number_val = float(number_str)
             else:
                 number_val = int(number_str)
-            formatted = format_indian_number(int(float(number_str)))
+            formatted = format_indian_number(whole_rupees(number_str))
             return (number_str, formatted)
         except (ValueError, TypeError):
             return (number_str, number_str)
@@ -104,18 +87,15 @@ def extract_issue_price_number(issue_price_text):
     Example: "Rs. 95,500/- (Rupees Ninety-Five Thousand Five Hundred Only) per Debenture"
     Output: ("95500", "95,500")
     """
-    import re
-
     if not issue_price_text:
         return ("", "")
 
-    # Find first number pattern that may include commas
-    number_pattern = r'(?:Rs\.?\s*)?(\d+(?:,\d+)*(?:\.\d+)?)'
-    match = re.search(number_pattern, issue_price_text)
-    if match:
-        number_str = match.group(1).replace(',', '')
+    # First number, which may include comma grouping
+    tokens = tokenize_numbers(issue_price_text)
+    if tokens:
+        number_str = tokens[0].grouped.replace(',', '')
         try:
-            number_int = int(float(number_str))
+            number_int = whole_rupees(number_str)
             formatted = format_indian_number(number_int)
             return (number_str, formatted)
         except (ValueError, TypeError):
@@ -0,0 +1,46 @@
+"""Compare output formats: write time and size of one converted document per sink.
+
+Usage (from the backend directory):
+    python benchmark_sinks.py path/to/term_sheet.docx [more.docx ...] [--date 2025-01-01] [--repeat 50]
+
+Each document is extracted once; every available sink then writes it `--repeat` times
+to memory. Install pyarrow to include parquet.
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+
+from app.core.document_processor_new import DocumentProcessor
+from app.core.output_sinks import OUTPUT_SINKS
+
+
+def benchmark(docx_path: str, processing_date: str, repeat: int, debug: bool):
+    processor = DocumentProcessor(debug=debug)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor._extract(docx_path, processing_date)
+    extract_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\n📄 {os.path.basename(docx_path)}: {len(processor.data_dict)} fields, extracted in {extract_ms:.1f} ms")
+    print(f"{'format':<10}{'ms / write':>12}{'bytes':>12}")
+    for name, sink_class in OUTPUT_SINKS.items():
+        sink = sink_class()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            output = io.BytesIO()
+            sink.write(processor.data_dict, output, processor.debug_info, debug, processor.coupon_records)
+        write_ms = (time.perf_counter() - start) * 1000 / repeat
+        print(f"{name:<10}{write_ms:>12.2f}{len(output.getvalue()):>12,}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('docx', nargs='+', help='Term sheets to convert')
+    parser.add_argument('--date', default=time.strftime('%Y-%m-%d'), help='Processing date (YYYY-MM-DD)')
+    parser.add_argument('--repeat', type=int, default=50, help='Writes per format')
+    parser.add_argument('--no-debug', action='store_true', help='Leave out the Debug_Log sheet of xlsx output')
+    args = parser.parse_args()
+    for path in args.docx:
+        benchmark(path, args.date, args.repeat, not args.no_debug)
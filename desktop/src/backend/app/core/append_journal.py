@@ -0,0 +1,213 @@
+import json
+import os
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from src.backend.app.core.config import APPEND_JOURNAL_GROWTH, APPEND_JOURNAL_MIN_BATCH
+from src.backend.app.utils.column_registry import ColumnRegistry
+from src.backend.app.utils.excel_utils import ExcelWriter
+
+JOURNAL_SUFFIX = '.journal'
+REGISTRY_SUFFIX = '.columns.json'
+
+
+class AppendJournal:
+    """Append-only journal of documents waiting to be added to a master workbook.
+
+    `append()` adds one JSON line to <workbook>.journal and returns. `compact()` folds
+    every journaled document into the workbook with a single read and write. It runs on
+    its own once the journal holds `growth` times as many documents as the workbook has
+    rows (and at least `min_batch`), so the cost of rewriting the workbook is spread over
+    a number of appends that grows with it: amortized O(1) per document instead of O(N).
+    Journaled documents survive a crash and are written by the next compaction.
+    `write_now()` skips the journal and writes a document at once, for callers that
+    append immediately.
+
+    Rows are keyed by field name. The Terms columns are kept in a ColumnRegistry saved
+    as <workbook>.columns.json, so a document with new fields only adds registry entries
+    and the workbook is not opened until compaction.
+    """
+
+    def __init__(self, xlsx_file_path: str, debug: bool = True, min_batch: int = APPEND_JOURNAL_MIN_BATCH,
+                 growth: float = APPEND_JOURNAL_GROWTH, verbose: bool = False):
+        """
+        Args:
+            debug (bool): Journal debug rows and append them to Debug_Log on compaction.
+                When False, no debug rows are added and an existing Debug_Log is kept as it is.
+            verbose (bool): Print a line for every compaction
+        """
+        self.xlsx_file_path = xlsx_file_path
+        self.journal_path = xlsx_file_path + JOURNAL_SUFFIX
+        self.registry_path = xlsx_file_path + REGISTRY_SUFFIX
+        self.debug = debug
+        self.min_batch = min_batch
+        self.growth = growth
+        self.verbose = verbose
+        self.registry: Optional[ColumnRegistry] = None
+        self._pending = 0
+        # Journal and workbook state after our last look; any change means another writer
+        # (or an edit outside the app) touched them
+        self._state = None
+
+    @property
+    def pending(self) -> int:
+        """Documents journaled but not yet in the workbook"""
+        self._load()
+        return self._pending
+
+    def append(self, data_to_append, debug_info_to_append: list = None, coupon_records_to_append: list = None) -> bool:
+        """
+        Journal one document's Terms row, debug rows and coupon records
+        Returns:
+            bool: True if the journal was compacted into the workbook
+        Raises:
+            ValueError: If the row cannot be matched to the workbook's columns
+        """
+        self._load()
+        if data_to_append:
+            # Registers new columns, and fails now rather than at compaction for values
+            # that do not fit, like an immediate append would
+            columns = len(self.registry)
+            ExcelWriter.terms_rows(data_to_append, self.registry)
+            if len(self.registry) != columns:
+                self.registry.save()
+
+        entry = {
+            'terms': data_to_append,
+            'debug': debug_info_to_append if self.debug else None,
+            'coupons': [record._asdict() for record in coupon_records_to_append or ()],
+        }
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+        self._state = self._file_states()
+        self._pending += 1
+
+        if self._pending >= max(self.min_batch, self.growth * self.registry.rows):
+            self.compact()
+            return True
+        return False
+
+    def compact(self) -> int:
+        """
+        Write every journaled document into the workbook and clear the journal
+        Returns:
+            int: Number of documents written
+        """
+        entries = self._read_entries()
+        if not entries:
+            return 0
+        self._load()
+        self._write(self._journaled_batch(entries))
+        if self.verbose:
+            print(f"📒 Wrote {len(entries)} journaled documents to {self.xlsx_file_path}")
+        return len(entries)
+
+    def write_now(self, data_to_append, debug_info_to_append: list = None,
+                  coupon_records_to_append: list = None) -> int:
+        """
+        Write one document into the workbook right away, after any journaled documents.
+        The document itself is never journaled, so if the write fails (e.g. the workbook
+        is open in Excel) nothing of it is kept and retrying does not add it twice.
+        Returns:
+            int: Number of documents written
+        Raises:
+            ValueError: If the row cannot be matched to the workbook's columns
+        """
+        self._load()
+        entries = self._read_entries()
+        batch = self._journaled_batch(entries)
+        batch.append((data_to_append, debug_info_to_append if self.debug else None, coupon_records_to_append))
+        try:
+            self._write(batch)
+        except Exception:
+            # Columns of the failed document may have been registered; reload the saved registry
+            self._state = None
+            raise
+        return len(batch)
+
+    def _write(self, batch: List[Tuple]):
+        """Append a batch to the workbook, then clear the journal it included"""
+        ExcelWriter.append_batch_to_excel(self.xlsx_file_path, batch, self.debug, self.registry)
+        self.registry.workbook = _file_state(self.xlsx_file_path)
+        self.registry.save()
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._pending = 0
+        self._state = self._file_states()
+
+    @staticmethod
+    def _journaled_batch(entries: List[Dict]) -> List[Tuple]:
+        return [(entry['terms'], entry['debug'], _decode_coupons(entry['coupons'])) for entry in entries]
+
+    def _load(self):
+        """Pick up the column registry and the journal's pending documents"""
+        state = self._file_states()
+        if state == self._state and self.registry is not None:
+            return
+        self.registry = self._load_registry()
+        entries = self._read_entries()
+        self._pending = len(entries)
+        self._state = state
+
+    def _file_states(self) -> Tuple:
+        return _file_state(self.journal_path), _file_state(self.xlsx_file_path)
+
+    def _load_registry(self) -> ColumnRegistry:
+        """The saved registry, or one read from the workbook if it is not the workbook the registry describes"""
+        registry = ColumnRegistry.load(self.registry_path)
+        workbook = _file_state(self.xlsx_file_path)
+        if registry is not None and registry.workbook == workbook:
+            return registry
+        columns, rows = _terms_summary(self.xlsx_file_path)
+        registry = ColumnRegistry(columns or (), rows, self.registry_path, workbook)
+        # Fields of documents journaled against an earlier layout
+        for entry in self._read_entries():
+            if isinstance(entry['terms'], dict):
+                registry.add(entry['terms'])
+        registry.save()
+        return registry
+
+    def _read_entries(self) -> List[Dict]:
+        try:
+            with open(self.journal_path, encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+
+def _file_state(path: str) -> Optional[List[int]]:
+    """[mtime_ns, size] of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _terms_summary(xlsx_file_path: str) -> Tuple[Optional[List[str]], int]:
+    """Header and number of data rows of the Terms sheet, without loading its cells"""
+    from openpyxl import load_workbook
+
+    try:
+        workbook = load_workbook(xlsx_file_path, read_only=True)
+    except FileNotFoundError:
+        return None, 0
+    try:
+        if "Terms" not in workbook.sheetnames:
+            return None, 0
+        worksheet = workbook["Terms"]
+        header = next(worksheet.iter_rows(max_row=1, values_only=True), None)
+        rows = max(worksheet.max_row - 1, 0)
+        if not header or not rows:
+            return None, 0
+        return list(header), rows
+    finally:
+        workbook.close()
+
+
+def _decode_coupons(records: List[Dict]) -> List[Dict]:
+    """Journaled coupon records with their dates restored"""
+    for record in records:
+        if isinstance(record.get('date'), str):
+            record['date'] = date.fromisoformat(record['date'])
+    return records
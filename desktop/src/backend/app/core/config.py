@@ -0,0 +1,88 @@
+import os
+
+# Bump whenever extraction or field processing changes its output, so persisted
+# per-row and per-document results from older code are not reused
+EXTRACTOR_VERSION = 7
+
+# Result cache for repeated conversions of the same document (see core/result_cache.py).
+# The web backend and the desktop app each keep their own subdirectory.
+RESULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.docx_processor', 'result_cache')
+RESULT_CACHE_WEB_DIR = os.path.join(RESULT_CACHE_DIR, 'web')
+RESULT_CACHE_DESKTOP_DIR = os.path.join(RESULT_CACHE_DIR, 'desktop')
+RESULT_CACHE_MEMORY_ENTRIES = 32
+RESULT_CACHE_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+# Deferred appends to a master workbook (see core/append_journal.py): rows are journaled
+# next to the workbook and folded in once the journal holds this many documents, or
+# this fraction of the rows already in the workbook if that is more
+APPEND_JOURNAL_MIN_BATCH = 25
+APPEND_JOURNAL_GROWTH = 0.5
+
+# Fields the mail-merge templates depend on. Pass these as `required_fields` to
+# DocumentProcessor to stop reading a document as soon as all of them are extracted.
+MERGE_REQUIRED_FIELDS = (
+    'Product Code',
+    'Issue Size',
+    'Face Value',
+    'Tenor In Days',
+    'Issue Price',
+    'Issue Opening Date',
+    'Issue Closing Date',
+    'Coupon',
+)
+
+# Cells containing one of these phrases are not used as keys...
+SKIP_PHRASES = (
+    'terms of issue',
+    'terms and conditions',
+    '>>',
+    '***',
+    '*****',
+)
+
+# ...unless they also contain one of these valid headers
+VALID_HEADERS = (
+    'issue price',
+    'issue opening date',
+    'issue closing date',
+    'discount at which security is issued',
+    'coupon',
+)
+
+# Rows with three or more columns labelled with one of these, optionally numbered
+# ("Coupon", "Step-up Coupon 2", "Cash Flow 3"; compared after casefolding and removing
+# punctuation and whitespace), are coupon or cash-flow rows. Labels that only start
+# with one, like "Coupon Rate", are ordinary terms. Schedule rows are extracted by
+# Strategy 3 and also listed on the Coupon_Schedule sheet.
+COUPON_ROW_LABELS = (
+    'coupon',
+    'stepupcoupon',
+    'cashflow',
+)
+
+# Header phrases that mark a table as a terms-of-issue table outright
+TERM_TABLE_HEADERS = (
+    'terms of issue',
+    'terms and conditions',
+    'summary of terms',
+    'term sheet',
+)
+
+# Row labels typical of terms tables; a table whose leading rows use one of these as
+# their label is treated as a terms table by the table classifier
+TERM_TABLE_LABELS = (
+    'issuer',
+    'product code',
+    'security name',
+    'isin',
+    'issue size',
+    'face value',
+    'issue price',
+    'tenor',
+    'coupon',
+    'issue opening date',
+    'issue closing date',
+    'date of allotment',
+    'redemption',
+    'discount at which security is issued',
+)
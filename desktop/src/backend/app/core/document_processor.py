@@ -4,6 +4,7 @@ import re
 from datetime import datetime
 from app.utils.text_utils import extract_series_number, extract_issue_size_number
 from app.utils.date_utils import handle_processing_date
+from app.core.field_keys import KeyCounters
 from app.utils.number_utils import extract_tenor_days_number, extract_face_value_number, calculate_amount_raised, extract_discount_value_number, extract_issue_price_number
 """
 OLD CODE: WILL BE MARKED TO DELETE LATER
@@ -18,6 +19,7 @@ class DocumentProcessor:
         doc = Document(docx_file_path)
         
         data_dict = {}
+        keys = KeyCounters(data_dict)
         debug_info = []
         
         for table_idx, table in enumerate(doc.tables):
@@ -99,11 +101,7 @@ class DocumentProcessor:
                                     clean_value = value.strip() if value else "Present"
                                     
                                     # Handle duplicate keys
-                                    original_key = clean_key
-                                    counter = 1
-                                    while clean_key in data_dict:
-                                        clean_key = f"{original_key}_{counter}"
-                                        counter += 1
+                                    clean_key = keys.unique(clean_key)
                                     
                                     data_dict[clean_key] = clean_value
                                     if debug:
@@ -149,11 +147,7 @@ class DocumentProcessor:
                                         clean_value = value.strip() if value else "Present"
                                         
                                         # Handle duplicate keys
-                                        original_key = clean_key
-                                        counter = 1
-                                        while clean_key in data_dict:
-                                            clean_key = f"{original_key}_{counter}"
-                                            counter += 1
+                                        clean_key = keys.unique(clean_key)
                                         
                                         data_dict[clean_key] = clean_value
                                         if debug:
@@ -204,8 +198,8 @@ class DocumentProcessor:
                             if combined_value:
                                 data_dict['coupon_data'].append(combined_value)
                                 
-                                # Determine if this is first or second coupon entry
-                                coupon_key = 'Coupon' if 'Coupon' not in data_dict else 'Coupon_1'
+                                # Coupon, Coupon_1, Coupon_2, ... in order of appearance
+                                coupon_key = keys.unique('Coupon')
                                 data_dict[coupon_key] = combined_value
                                 
                                 if debug:
@@ -232,11 +226,7 @@ class DocumentProcessor:
                         clean_value = value.strip() if value else "Present"
                         
                         # Handle duplicate keys
-                        original_key = clean_key
-                        counter = 1
-                        while clean_key in data_dict:
-                            clean_key = f"{original_key}_{counter}"
-                            counter += 1
+                        clean_key = keys.unique(clean_key)
                         
                         data_dict[clean_key] = clean_value
                         if processing_date:
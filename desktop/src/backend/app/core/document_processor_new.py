@@ -1,138 +1,377 @@
-from docx import Document
-import re
-from src.backend.app.utils.date_utils import handle_processing_date
-from src.backend.app.utils.excel_utils import ExcelWriter
+import io
+import os
+from contextlib import closing
 from src.backend.app.utils.debug_utils import DebugLogger
-from src.backend.app.core.extraction_strategies import ExtractionStrategy
+from src.backend.app.core.append_journal import AppendJournal
+from src.backend.app.core.config import SKIP_PHRASES, VALID_HEADERS
+from src.backend.app.core.docx_package import DocxPackage
+from src.backend.app.core.field_keys import KeyCounters
+from src.backend.app.core.output_sinks import get_output_sink
+from src.backend.app.core.phrase_matcher import HEADER, SKIP, PhraseMatcher
+from src.backend.app.core.result_cache import result_cache_key
+from src.backend.app.core.revision_store import revision_key_from_filename, row_hash
+from src.backend.app.core.strategy_planner import StrategyPlanner
+from src.backend.app.core.table_readers import get_table_reader
 from src.backend.app.processors.field_processors import FieldProcessor
+from src.backend.app.processors.field_schema import FieldSchemaLoader, default_field_schema
 
 class DocumentProcessor:
-    def __init__(self, debug=True):
+    def __init__(self, debug=True, reader='lxml', required_fields=None, table_classifier=None,
+                 traversal='tables', revision_store=None, result_cache=None,
+                 skip_phrases=SKIP_PHRASES, valid_headers=VALID_HEADERS, field_schema=None,
+                 defer_appends=False, append_debug_log=True, output_format='xlsx'):
+        """
+        Args:
+            debug (bool): Print extraction details and write the Debug_Log sheet
+            reader (str): Table reader to use - 'lxml' streams word/document.xml,
+                'docx' uses the python-docx object model
+            required_fields (iterable): Optional field names (e.g. config.MERGE_REQUIRED_FIELDS).
+                When given, table traversal stops as soon as all of them are extracted
+                and the 'early_exit' column records where that happened.
+            table_classifier (TableClassifier): Optional classifier used to skip tables that
+                are not terms-of-issue tables (signature blocks, schedules, ...)
+            traversal (str): 'tables' reads top-level tables only; 'body' walks the document
+                body once and also extracts nested tables and "Label: value" paragraphs
+            revision_store (RevisionStore): Optional store of per-row results. Re-processing a
+                revision of a known series then only re-extracts rows whose content changed,
+                and the 'changed_fields' column lists what differs from the last revision.
+            result_cache (ResultCache): Optional cache of finished conversions keyed on the
+                document bytes and processing date. Not used together with revision_store,
+                whose 'changed_fields' column depends on the previous run.
+            skip_phrases (iterable): Phrases that disqualify a cell from being used as a key
+            valid_headers (iterable): Phrases that make a cell a key even if it holds a skip phrase
+            field_schema (str | FieldSchemaLoader): Field schema JSON path or loader; the bundled
+                processors/field_schema.json if None. Edits to the file apply from the next document.
+            defer_appends (bool): Journal documents appended to a master workbook and write them
+                in batches (see core/append_journal.py) instead of rewriting it on every append.
+                Call flush_appends() to write outstanding documents.
+            append_debug_log (bool): Add each document's debug rows to the Debug_Log sheet of
+                master workbooks. When False, an existing Debug_Log is kept unchanged.
+            output_format (str): Default output sink - 'xlsx', 'csv', 'jsonl' or 'parquet' (with
+                pyarrow installed); see core/output_sinks.py. Master workbooks are always xlsx.
+        """
         self.debug = debug
+        self.reader = get_table_reader(reader)
+        self.output_sink = get_output_sink(output_format)
+        if traversal not in ('tables', 'body'):
+            raise ValueError(f"Unknown traversal '{traversal}'. Use 'tables' or 'body'")
+        self.traversal = traversal
+        self.required_fields = frozenset(required_fields) if required_fields else frozenset()
+        self.table_classifier = table_classifier
+        self.revision_store = revision_store
+        self.result_cache = result_cache
+        self.defer_appends = defer_appends
+        self.append_debug_log = append_debug_log
+        self._journals = {}
+        # Compiled once; strategies scan each cell for all phrases in a single pass
+        self.phrase_matcher = PhraseMatcher({SKIP: skip_phrases, HEADER: valid_headers})
+        # Sends each row to the single strategy that fits its shape; extend via register()
+        self.planner = StrategyPlanner(self.phrase_matcher)
+        if field_schema is None:
+            field_schema = default_field_schema()
+        elif not isinstance(field_schema, FieldSchemaLoader):
+            field_schema = FieldSchemaLoader(field_schema)
+        self.field_schema = field_schema
+        self._plan = field_schema.plan()
         self.data_dict = {}
+        self.keys = KeyCounters(self.data_dict)
+        # Typed coupon / cash-flow rows, written to the Coupon_Schedule sheet
+        self.coupon_records = []
         self.debug_info = []
+        self.early_exit = None
+        self._revision = None
+        self._found_fields = set()
         if self.debug:
             self.logger = DebugLogger()
 
     # Enhanced function for better table structure handling
-    def convert_docx_to_xlsx(self, docx_file_path, xlsx_file_path, processing_date=None, append_to_file=None):
+    def convert_docx_to_xlsx(self, docx_file_path, xlsx_file_path, processing_date=None, append_to_file=None,
+                             revision_key=None, output_format=None):
+        """
+        Args:
+            xlsx_file_path (str): Output path, written in the output format
+            output_format (str): Output sink for this call; the processor's default if None
+        """
+        sink = self._output_sink(output_format)
+        if self._use_result_cache():
+            with open(docx_file_path, 'rb') as f:
+                docx_data = f.read()
+            workbook = self._convert(io.BytesIO(docx_data), docx_data, processing_date, revision_key, sink)
+            with open(xlsx_file_path, 'wb') as f:
+                f.write(workbook)
+        else:
+            self._extract(docx_file_path, processing_date, revision_key)
+            sink.write(self.data_dict, xlsx_file_path, self.debug_info, self.debug, self.coupon_records)
+        
+        if append_to_file:
+            # Keyed by field name: the master's column registry places each value, adds
+            # columns for new fields and leaves missing ones blank
+            journal = self._append_journal(append_to_file)
+            if self.defer_appends:
+                journal.append(dict(self.data_dict), list(self.debug_info), self.coupon_records)
+            else:
+                journal.write_now(dict(self.data_dict), list(self.debug_info), self.coupon_records)
+        return self.data_dict
+
+    def flush_appends(self):
+        """Write documents still journaled for master workbooks"""
+        for journal in self._journals.values():
+            journal.compact()
+
+    def _append_journal(self, xlsx_file_path) -> AppendJournal:
+        journal = self._journals.get(xlsx_file_path)
+        if journal is None:
+            journal = AppendJournal(xlsx_file_path, debug=self.debug and self.append_debug_log, verbose=self.debug)
+            self._journals[xlsx_file_path] = journal
+        return journal
+
+    def convert_docx_bytes(self, docx_data, processing_date=None, revision_key=None, output_format=None) -> bytes:
+        """
+        Convert an in-memory .docx without touching the filesystem
+        Args:
+            docx_data (bytes | file-like): Raw .docx bytes or a seekable binary file object
+            processing_date (str): Date in YYYY-MM-DD format
+            revision_key (str): Series key for incremental re-extraction (e.g. the filename)
+            output_format (str): Output sink for this call; the processor's default if None
+        Returns:
+            bytes: The generated xlsx workbook, or the document in the requested format
+        """
+        if not isinstance(docx_data, (bytes, bytearray, memoryview)):
+            docx_data = docx_data.read()
+        return self._convert(io.BytesIO(docx_data), docx_data, processing_date, revision_key,
+                             self._output_sink(output_format))
+
+    def _output_sink(self, output_format=None):
+        if output_format is None or output_format == self.output_sink.name:
+            return self.output_sink
+        return get_output_sink(output_format)
+
+    def _use_result_cache(self) -> bool:
+        return self.result_cache is not None and self.revision_store is None
+
+    def _cache_options(self) -> str:
+        """Processor settings that change the output, as part of the result cache key"""
+        return '|'.join((
+            self.reader.name,
+            self.traversal,
+            ','.join(sorted(self.required_fields)),
+            'classifier' if self.table_classifier else '',
+            'debug' if self.debug else '',
+            self.phrase_matcher.signature,
+            self.field_schema.plan().signature,
+        ))
+
+    def _convert(self, docx_source, docx_data, processing_date, revision_key, sink) -> bytes:
+        """Extract and render the output, or return the cached result for identical input"""
+        key = None
+        if self._use_result_cache():
+            key = result_cache_key(docx_data, processing_date, f"{self._cache_options()}|{sink.name}")
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                self.data_dict = dict(cached.data_dict)
+                self.debug_info = [dict(d) for d in cached.debug_info]
+                self.coupon_records = list(cached.coupon_records)
+                self.early_exit = None
+                if self.debug:
+                    self.logger.log_result_cache_hit(key, self.result_cache.stats())
+                return cached.workbook
+
+        self._extract(docx_source, processing_date, revision_key)
+        output = io.BytesIO()
+        sink.write(self.data_dict, output, self.debug_info, self.debug, self.coupon_records)
+        workbook = output.getvalue()
+        if key:
+            self.result_cache.put(key, self.data_dict, self.debug_info, workbook, self.coupon_records)
+        return workbook
+
+    def _extract(self, docx_source, processing_date=None, revision_key=None):
+        """Run table extraction and field processing for a .docx path or file object"""
         #need to reset values at every run because the desktop UI is using the same object as long as the app is open
         self.data_dict = {}
+        self.keys = KeyCounters(self.data_dict)
+        self.coupon_records = []
         self.debug_info = []
-        doc = Document(docx_file_path)
+        self.early_exit = None
+        self._found_fields = set()
+        # Picks up edits to the schema file since the previous document
+        self._plan = self.field_schema.plan()
+        self._revision = self._load_revision(docx_source, revision_key)
         # Process tables
-        self._process_tables(doc, processing_date)
+        if self.reader.lazy:
+            # Open the zip lazily so only the main document part is decompressed
+            with DocxPackage(docx_source) as package:
+                with closing(self._iter_blocks(package)) as tables:
+                    self._process_tables(tables, processing_date)
+                if self.debug:
+                    self.logger.log_package_read(package.bytes_read, package.size)
+        else:
+            with closing(self._iter_blocks(docx_source)) as tables:
+                self._process_tables(tables, processing_date)
+
+        if self.required_fields:
+            self._record_early_exit()
         
         if processing_date:
-            date_components = handle_processing_date(processing_date)
+            date_components = self._plan.input_columns('processing_date', processing_date)
             if date_components:
                 self.data_dict.update(date_components)
                 if self.debug:
                     self.logger.log_processing_date(processing_date)
                                 
                         
-        # Process all special fields including dates
-        self.data_dict = FieldProcessor.process_special_fields(self.data_dict, self.debug)
-        ExcelWriter.write_to_excel(self.data_dict, xlsx_file_path, self.debug_info, self.debug)
-        
-        # Prepare data for appending: only values, not headers
-        data_to_append = list(self.data_dict.values()) if self.data_dict else []
-
-        # Prepare debug info for appending: only values, not headers
-        debug_info_to_append = [list(d.values()) for d in self.debug_info] if self.debug_info else []
+        # Process all special fields including dates; derived columns of a previous revision
+        # are only reused if they were produced by the same schema
+        revision = self._revision
+        previous = revision.fields if revision and revision.schema == self._plan.signature else None
+        self.data_dict = FieldProcessor.process_special_fields(self.data_dict, self.debug, previous, self._plan)
 
-        if append_to_file:
-            ExcelWriter.append_to_excel(
-                data_to_append, append_to_file, debug_info_to_append, self.debug
-            )
+        if self._revision:
+            self._record_revision(processing_date)
         return self.data_dict
+
+    def _load_revision(self, docx_source, revision_key):
+        """Previous revision of this document's series, if incremental extraction is enabled"""
+        if not self.revision_store:
+            return None
+        if revision_key is None and isinstance(docx_source, (str, os.PathLike)):
+            revision_key = revision_key_from_filename(docx_source)
+        if not revision_key:
+            if self.debug:
+                print("⚠️ No revision key for this document - incremental extraction disabled")
+            return None
+        return self.revision_store.load(revision_key)
+
+    def _record_revision(self, processing_date):
+        """Add the 'changed_fields' column and persist this revision's row results"""
+        revision = self._revision
+        ignore = set(self._plan.input_columns('processing_date', processing_date) or {})
+        ignore.update(('early_exit', 'changed_fields'))
+        changed = revision.changed_fields(self.data_dict, ignore)
+        if revision.is_first:
+            self.data_dict['changed_fields'] = "New document"
+        else:
+            self.data_dict['changed_fields'] = ', '.join(changed) if changed else "None"
+        if self.debug:
+            self.logger.log_revision(revision.key, revision.reused, len(revision.new_rows), changed)
+        self.revision_store.save(revision, self.data_dict, self._plan.signature)
     
-    def _process_tables(self, doc, processing_date):
-        """Process all tables in the document"""
+    def _iter_blocks(self, source):
+        """Row blocks from the reader: top-level tables, or every table and key/value paragraph run"""
+        if self.traversal == 'body':
+            return self.reader.iter_body(source)
+        return self.reader.iter_tables(source)
+
+    def _process_tables(self, tables, processing_date):
+        """Process all row blocks yielded by the table reader as (table_idx, rows) pairs"""
         # ... table processing logic using ExtractionStrategy ...
-        for table_idx, table in enumerate(doc.tables):
+        missing_fields = set(self.required_fields)
+        self.planner.start_document(self.coupon_records)
+        if self.table_classifier:
+            self.table_classifier.start_document()
+
+        for table_idx, rows in tables:
+            if self.table_classifier:
+                is_terms, rows, cached = self.table_classifier.classify(rows)
+                if not is_terms:
+                    if self.debug:
+                        self.logger.log_table_skipped(table_idx, cached)
+                    continue
+
             if self.debug:
                 print(f"\n📋 Processing Table {table_idx + 1}:")
             
-            for row_idx, row in enumerate(table.rows):
-                # Clean and extract all cell contents
-                cells = []
-                for cell in row.cells:
-                    cell_text = cell.text.strip().replace('\n', ' ').replace('\t', ' ')
-                    cell_text = re.sub(r'\s+', ' ', cell_text).strip()
-                    cells.append(cell_text)
-                
+            # Each row arrives as a TableRow with one normalized string per physical cell
+            for row_idx, row in enumerate(rows):
                 # Print debug info after cell text extraction
                 if self.debug:
-                    self.logger.print_row_debug(row_idx, cells)
+                    self.logger.print_row_debug(row_idx, row)
 
                 # Skip completely empty rows
-                if not any(cells):
+                if not row.non_empty_count:
                     continue
                 
                 # Skip header rows (containing "TERMS OF ISSUE")
-                if any("TERMS OF ISSUE" in cell.upper() for cell in cells):
+                if any("terms of issue" in cell for cell in row.folded):
                     continue
                 
-                # Define common phrases and headers
-                skip_phrases = [
-                    'terms of issue',
-                    'terms and conditions',
-                    '>>',
-                    '***',
-                    '*****'
-                ]
-                valid_headers = [
-                    'issue price',
-                    'issue opening date',
-                    'issue closing date',
-                    'discount at which security is issued',
-                    'coupon'
-                ]
-                
-                # Try strategies in order - stop when one succeeds
-                strategies = [
-                    (ExtractionStrategy.apply_strategy1, "Strategy 1"),
-                    (ExtractionStrategy.apply_strategy2, "Strategy 2"),
-                    (ExtractionStrategy.apply_strategy3, "Strategy 3")
-                ]
-                
-                for strategy_func, strategy_name in strategies:
-                    key, value, extraction_method = strategy_func(cells, valid_headers, skip_phrases) if strategy_name != "Strategy 3" else strategy_func(cells, self.data_dict)
-                    
+                # Rows unchanged since the previous revision reuse their stored result
+                digest = row_hash(row) if self._revision else None
+                previous_result = self._revision.lookup(digest) if digest else None
+                if previous_result:
+                    strategy_name, clean_key, clean_value = previous_result
+                    self._store_field(table_idx, row_idx, row, f"{strategy_name} (unchanged)", clean_key, clean_value)
+                else:
+                    # Run the one strategy planned for this row's shape
+                    rule, key, value, extraction_method = self.planner.apply(row, self.data_dict)
+
                     if key and key.strip():
+                        strategy_name = rule.name
                         clean_key = key.strip()
                         clean_value = value.strip() if value else "Present"
                         self.logger.log_strategy_success(strategy_name, clean_key, clean_value) if self.debug else None
-                        # Handle duplicate keys
-                        clean_key = self._handle_duplicate_key(clean_key)
-                        
-                        # Store the data
-                        self.data_dict[clean_key] = clean_value
-                        
-                        # Add debug info
-                        if self.debug:
-                            self.debug_info.append(self.logger.add_debug_info(
-                                table_idx, row_idx, strategy_name, clean_key, clean_value, cells
-                            ))
-                        # Break after first successful strategy
+                        if digest and rule.reusable:
+                            self._revision.record(digest, (strategy_name, clean_key, clean_value))
+                        self._store_field(table_idx, row_idx, row, strategy_name, clean_key, clean_value)
+
+                # Stop reading once every required field has been captured
+                if missing_fields:
+                    missing_fields.difference_update([f for f in missing_fields if self._has_field(f)])
+                    if not missing_fields:
+                        self.early_exit = (table_idx, row_idx)
                         break
 
+            if self.early_exit:
+                break
+
+        if self.table_classifier:
+            self.table_classifier.save()
+
+        if self.debug:
+            self.logger.log_strategy_hits(self.planner.hits)
+
         if processing_date:
             self._handle_processing_date(processing_date)
 
+    def _record_early_exit(self):
+        """Add the early-exit indicator column for runs with required fields"""
+        if self.early_exit:
+            table_idx, row_idx = self.early_exit
+            self.data_dict['early_exit'] = f"Yes (Table {table_idx + 1}, Row {row_idx + 1})"
+        else:
+            self.data_dict['early_exit'] = "No"
+        if self.debug:
+            missing = sorted(f for f in self.required_fields if not self._has_field(f))
+            self.logger.log_early_exit(self.early_exit, missing)
+
+    def _has_field(self, field) -> bool:
+        """Whether a field was extracted under its canonical name or any spelling of it"""
+        return field in self.data_dict or field in self._found_fields
+
+    def _store_field(self, table_idx, row_idx, row, method, key, value):
+        """Store an extracted key/value pair under a unique key and record debug info"""
+        canonical = self._plan.index.canonical(key)
+        if canonical:
+            self._found_fields.add(canonical)
+
+        # Handle duplicate keys
+        clean_key = self._handle_duplicate_key(key)
+
+        # Store the data
+        self.data_dict[clean_key] = value
+
+        # Add debug info
+        if self.debug:
+            self.debug_info.append(self.logger.add_debug_info(
+                table_idx, row_idx, method, clean_key, value, row
+            ))
+
     def _handle_duplicate_key(self, key: str) -> str:
         """Handle duplicate keys by adding counter"""
-        original_key = key
-        counter = 1
-        while key in self.data_dict:
-            key = f"{original_key}_{counter}"
-            counter += 1
-        return key
+        return self.keys.unique(key)
 
     def _handle_processing_date(self, processing_date: str):
         """Handle processing date components"""
-        date_components = handle_processing_date(processing_date)
+        date_components = self._plan.input_columns('processing_date', processing_date)
         if date_components:
             self.data_dict.update(date_components)
             if self.debug:
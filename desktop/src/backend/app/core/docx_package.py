@@ -0,0 +1,101 @@
+import posixpath
+import zipfile
+
+from lxml import etree
+
+PACKAGE_RELS_PART = '_rels/.rels'
+DEFAULT_DOCUMENT_PART = 'word/document.xml'
+OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+class _CountingFile:
+    """Binary file wrapper that counts the bytes actually read from the underlying file"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def seek(self, offset, whence=0):
+        return self._fileobj.seek(offset, whence)
+
+    def tell(self):
+        return self._fileobj.tell()
+
+    def seekable(self):
+        return True
+
+
+class DocxPackage:
+    """Lazy view of a .docx zip archive.
+
+    Only the central directory and the members that are explicitly opened are read, so
+    embedded media, fonts and customXml parts are never decompressed. `bytes_read`
+    reports how much of the file has been touched so far.
+    """
+
+    def __init__(self, source):
+        """
+        Args:
+            source (str | file-like): Path to the .docx or a seekable binary file object
+        """
+        if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+            self._fileobj = open(source, 'rb')
+            self._owns_file = True
+        else:
+            self._fileobj = source
+            self._owns_file = False
+
+        self._fileobj.seek(0, 2)
+        self.size = self._fileobj.tell()
+        self._fileobj.seek(0)
+
+        self._counter = _CountingFile(self._fileobj)
+        self._zip = zipfile.ZipFile(self._counter)
+        self._main_part = None
+
+    @property
+    def bytes_read(self) -> int:
+        return self._counter.bytes_read
+
+    @property
+    def main_document_part(self) -> str:
+        """Member name of the main document part, resolved from the package relationships"""
+        if self._main_part is None:
+            self._main_part = self._resolve_main_part()
+        return self._main_part
+
+    def open(self, name: str):
+        """Open a single member for streaming decompression"""
+        return self._zip.open(name)
+
+    def open_main_document(self):
+        return self.open(self.main_document_part)
+
+    def close(self):
+        self._zip.close()
+        if self._owns_file:
+            self._fileobj.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _resolve_main_part(self) -> str:
+        try:
+            with self.open(PACKAGE_RELS_PART) as stream:
+                rels = etree.parse(stream, etree.XMLParser(resolve_entities=False))
+        except KeyError:
+            return DEFAULT_DOCUMENT_PART
+
+        for rel in rels.getroot().iterchildren(f'{{{REL_NS}}}Relationship'):
+            if rel.get('Type') == OFFICE_DOCUMENT_REL:
+                return posixpath.normpath(rel.get('Target', DEFAULT_DOCUMENT_PART).lstrip('/'))
+        return DEFAULT_DOCUMENT_PART
@@ -0,0 +1,29 @@
+from typing import Dict
+
+
+class KeyCounters:
+    """Duplicate-key suffixing for one data_dict in constant time.
+
+    Repeated keys are stored as `key`, `key_1`, `key_2`, ... exactly as the old probing
+    loop did, but the next suffix per base key is remembered instead of probing from 1
+    each time. Keys are only ever added to the dict during extraction, so the remembered
+    suffix is always the smallest free one.
+    """
+
+    def __init__(self, data_dict: Dict):
+        self.data_dict = data_dict
+        self._next_suffix: Dict[str, int] = {}
+
+    def unique(self, key: str) -> str:
+        """First free name for `key` in the dict"""
+        data_dict = self.data_dict
+        if key not in data_dict:
+            return key
+        counter = self._next_suffix.get(key, 1)
+        candidate = f"{key}_{counter}"
+        # Only loops when a document itself contains a label like "Coupon_1"
+        while candidate in data_dict:
+            counter += 1
+            candidate = f"{key}_{counter}"
+        self._next_suffix[key] = counter + 1
+        return candidate
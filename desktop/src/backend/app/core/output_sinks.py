@@ -0,0 +1,104 @@
+import csv
+import io
+import json
+import os
+from contextlib import contextmanager
+from importlib.util import find_spec
+from typing import Dict, Iterator, List, Sequence
+
+from src.backend.app.utils.excel_utils import ExcelWriter
+
+
+@contextmanager
+def _binary_output(target) -> Iterator:
+    """A path opened for binary writing, or a binary file object as it is"""
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, 'wb') as f:
+            yield f
+    else:
+        yield target
+
+
+def _text_output(target):
+    """A text layer over a binary target; detach() it when done so the target stays open"""
+    return io.TextIOWrapper(target, encoding='utf-8', newline='')
+
+
+class XlsxSink:
+    """Styled workbook with Terms, Coupon_Schedule and Debug_Log sheets (original behaviour)"""
+    name = 'xlsx'
+    extension = '.xlsx'
+    mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+    def write(self, data_dict: Dict, target, debug_info: List[Dict] = None, debug: bool = True,
+              coupon_records: Sequence = None):
+        ExcelWriter.write_to_excel(data_dict, target, debug_info, debug, coupon_records)
+
+
+# The formats below are for loaders: they hold the Terms row only, without styling,
+# coupon schedule or debug log, and never go through xlsxwriter
+
+class CsvSink:
+    """Terms as a header line and one row, UTF-8"""
+    name = 'csv'
+    extension = '.csv'
+    mimetype = 'text/csv'
+
+    def write(self, data_dict: Dict, target, debug_info: List[Dict] = None, debug: bool = True,
+              coupon_records: Sequence = None):
+        with _binary_output(target) as f:
+            text = _text_output(f)
+            writer = csv.writer(text)
+            writer.writerow(data_dict.keys())
+            writer.writerow('' if value is None else value for value in data_dict.values())
+            text.flush()
+            text.detach()
+
+
+class JsonLinesSink:
+    """Terms as one JSON object on a line of its own, so outputs can be concatenated"""
+    name = 'jsonl'
+    extension = '.jsonl'
+    mimetype = 'application/x-ndjson'
+
+    def write(self, data_dict: Dict, target, debug_info: List[Dict] = None, debug: bool = True,
+              coupon_records: Sequence = None):
+        line = json.dumps(data_dict, ensure_ascii=False, default=str) + '\n'
+        with _binary_output(target) as f:
+            f.write(line.encode('utf-8'))
+
+
+class ParquetSink:
+    """Terms as a one-row Parquet table; needs pyarrow"""
+    name = 'parquet'
+    extension = '.parquet'
+    mimetype = 'application/vnd.apache.parquet'
+
+    def write(self, data_dict: Dict, target, debug_info: List[Dict] = None, debug: bool = True,
+              coupon_records: Sequence = None):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        row = {key: value if value is None or isinstance(value, (str, int, float, bool)) else str(value)
+               for key, value in data_dict.items()}
+        table = pa.Table.from_pylist([row])
+        with _binary_output(target) as f:
+            pq.write_table(table, f)
+
+
+OUTPUT_SINKS = {
+    XlsxSink.name: XlsxSink,
+    CsvSink.name: CsvSink,
+    JsonLinesSink.name: JsonLinesSink,
+}
+if find_spec('pyarrow') is not None:
+    OUTPUT_SINKS[ParquetSink.name] = ParquetSink
+
+
+def get_output_sink(name: str):
+    """Instantiate the output sink registered under `name`"""
+    try:
+        return OUTPUT_SINKS[name]()
+    except KeyError:
+        hint = " (parquet needs pyarrow)" if name == ParquetSink.name else ""
+        raise ValueError(f"Unknown output format '{name}'{hint}. Available: {', '.join(OUTPUT_SINKS)}")
@@ -0,0 +1,180 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.backend.app.core.config import (
+    EXTRACTOR_VERSION,
+    RESULT_CACHE_MAX_DISK_BYTES,
+    RESULT_CACHE_MEMORY_ENTRIES,
+)
+from src.backend.app.core.coupon_schedule import CouponRecord
+
+
+class CachedResult(NamedTuple):
+    data_dict: Dict
+    debug_info: List[Dict]
+    workbook: bytes
+    coupon_records: Tuple = ()
+
+
+def result_cache_key(docx_data: bytes, processing_date: Optional[str] = None, options: str = '') -> str:
+    """Content address of a conversion: document bytes, processing date, extractor version
+    and the processor options that shape the output"""
+    digest = hashlib.sha256(docx_data)
+    digest.update(f"\x1f{processing_date or ''}\x1f{EXTRACTOR_VERSION}\x1f{options}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Two-tier cache of finished conversions keyed by `result_cache_key`.
+
+    The memory tier is an LRU of at most `max_entries` results. The optional disk tier
+    keeps one pickle per result under `directory` and evicts the least recently used
+    files once their total size exceeds `max_disk_bytes`. Disk hits are promoted to
+    memory. Counters are available from `stats()`.
+
+    Pickles hold only builtin types (coupon records as plain tuples), so they load
+    whatever package path the code runs under. A file that does not load is a miss.
+    The memory tier is shared by server threads and guarded by a lock.
+    """
+
+    def __init__(self, max_entries: int = RESULT_CACHE_MEMORY_ENTRIES, directory: Optional[str] = None,
+                 max_disk_bytes: int = RESULT_CACHE_MAX_DISK_BYTES):
+        """
+        Args:
+            max_entries (int): Results kept in memory
+            directory (str): Directory of the disk tier (memory only if None)
+            max_disk_bytes (int): Size cap of the disk tier
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: 'OrderedDict[str, CachedResult]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.memory_evictions = 0
+        self.disk_evictions = 0
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return result
+
+        result = self._read_disk(key)
+        with self._lock:
+            if result is not None:
+                self.disk_hits += 1
+                self._remember(key, result)
+                return result
+            self.misses += 1
+            return None
+
+    def put(self, key: str, data_dict: Dict, debug_info: List[Dict], workbook: bytes,
+            coupon_records=()) -> CachedResult:
+        # Copies, so later changes to the processor's state never leak into the cache
+        result = CachedResult(dict(data_dict), [dict(d) for d in debug_info], bytes(workbook),
+                              tuple(coupon_records))
+        with self._lock:
+            self._remember(key, result)
+        try:
+            self._write_disk(key, result)
+        except Exception as e:
+            # The disk tier is an optimisation; the conversion itself has succeeded
+            print(f"⚠️ Could not write cached result {key}: {e}")
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring"""
+        return {
+            'hits': self.memory_hits + self.disk_hits,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'memory_evictions': self.memory_evictions,
+            'disk_evictions': self.disk_evictions,
+            'memory_entries': len(self._memory),
+        }
+
+    def _remember(self, key: str, result: CachedResult):
+        """Add to the memory tier; the caller holds the lock"""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.memory_evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def _read_disk(self, key: str) -> Optional[CachedResult]:
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data_dict, debug_info, workbook, coupon_rows = pickle.load(f)
+            result = CachedResult(data_dict, debug_info, workbook, tuple(CouponRecord(*row) for row in coupon_rows))
+            # Mark as recently used for the disk eviction order
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Written by other code (an older layout, another copy of the package, ...)
+            print(f"⚠️ Ignoring unreadable cached result {path}: {e}")
+            return None
+        return result
+
+    def _write_disk(self, key: str, result: CachedResult):
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        coupon_rows = tuple(tuple(record) for record in result.coupon_records)
+        # A temporary file of its own, so concurrent writers of the same key never share one
+        f = tempfile.NamedTemporaryFile(dir=self.directory, prefix=f"{key}.", suffix='.tmp', delete=False)
+        try:
+            with f:
+                pickle.dump((result.data_dict, result.debug_info, result.workbook, coupon_rows), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, self._path(key))
+        except BaseException:
+            os.remove(f.name)
+            raise
+        self._enforce_disk_cap()
+
+    def _enforce_disk_cap(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.pkl'):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue  # Evicted by another thread
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+            with self._lock:
+                self.disk_evictions += 1
@@ -0,0 +1,372 @@
+import re
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from docx import Document
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from lxml import etree
+
+from src.backend.app.core.docx_package import DocxPackage
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+
+def _w(tag: str) -> str:
+    return f'{{{W_NS}}}{tag}'
+
+
+W_BODY = _w('body')
+W_TBL = _w('tbl')
+W_TR = _w('tr')
+W_TRPR = _w('trPr')
+W_GRID_BEFORE = _w('gridBefore')
+W_TC = _w('tc')
+W_TCPR = _w('tcPr')
+W_GRID_SPAN = _w('gridSpan')
+W_VMERGE = _w('vMerge')
+W_P = _w('p')
+W_R = _w('r')
+W_HYPERLINK = _w('hyperlink')
+W_T = _w('t')
+W_TAB = _w('tab')
+W_PTAB = _w('ptab')
+W_BR = _w('br')
+W_CR = _w('cr')
+W_NO_BREAK_HYPHEN = _w('noBreakHyphen')
+W_VAL = _w('val')
+W_TYPE = _w('type')
+
+
+class CellSpan(NamedTuple):
+    """Layout of one physical cell (w:tc) within the table grid"""
+    grid_col: int        # first layout-grid column covered by the cell
+    col_span: int        # number of grid columns covered (w:gridSpan)
+    continued: bool      # True when the cell continues a vertical merge from the row above
+
+
+class TableRow:
+    """A table row with exactly one entry per physical cell.
+
+    Horizontally merged cells appear once with their span recorded in `spans`, and
+    vMerge continuation cells reuse the text already extracted for the cell above.
+    `source` tells where the row came from: 'table', 'nested' (a table inside a cell)
+    or 'paragraph' (a "Label: value" body paragraph).
+
+    The raw, normalized and casefolded text of every cell, the non-empty mask and the
+    column count are computed once here and shared by the strategies and debug logger.
+    """
+    __slots__ = ('raw', 'cells', 'folded', 'non_empty', 'num_cols', 'non_empty_count', 'spans', 'source')
+
+    def __init__(self, raw: List[str], spans: List[CellSpan], source: str = 'table',
+                 cells: Optional[List[str]] = None):
+        """
+        Args:
+            raw (list): Cell text as stored in the document
+            spans (list): CellSpan per cell
+            source (str): 'table', 'nested' or 'paragraph'
+            cells (list): Already normalized text, when the reader has it cached
+        """
+        self.raw = raw
+        self.cells = cells if cells is not None else [normalize_cell_text(text) for text in raw]
+        self.folded = [cell.casefold() for cell in self.cells]
+        self.non_empty = [bool(cell) for cell in self.cells]
+        self.num_cols = len(self.cells)
+        self.non_empty_count = sum(self.non_empty)
+        self.spans = spans
+        self.source = source
+
+    def __len__(self) -> int:
+        return self.num_cols
+
+    def __repr__(self) -> str:
+        return f"TableRow({self.cells!r})"
+
+
+# Pairs yielded by a reader: (table_idx, rows) where rows yields TableRow objects
+TableRows = Tuple[int, Iterator[TableRow]]
+
+
+# "Issue Size: 500 Debentures" - a label starting with a letter, a colon, then the value
+KEY_VALUE_PARAGRAPH_RE = re.compile(r'^(?P<key>[^\W\d_][^:]{1,79}?)\s*:\s*(?P<value>\S.*)$')
+
+
+def normalize_cell_text(text: str) -> str:
+    """Collapse newlines, tabs and repeated whitespace into single spaces"""
+    return ' '.join(text.split())
+
+
+def paragraph_row(text: str) -> Optional[TableRow]:
+    """Turn a "Label: value" body paragraph into a two-cell row, or None for other paragraphs"""
+    match = KEY_VALUE_PARAGRAPH_RE.match(normalize_cell_text(text))
+    if not match:
+        return None
+    cells = [match.group('key'), match.group('value')]
+    return TableRow(cells, [CellSpan(0, 1, False), CellSpan(1, 1, False)], source='paragraph', cells=cells)
+
+
+class DocxTableReader:
+    """Read top-level tables through python-docx (original behaviour)"""
+    name = 'docx'
+    lazy = False
+
+    def iter_tables(self, source) -> Iterator[TableRows]:
+        """Yield (table_idx, rows) for every table in the document"""
+        doc = Document(source)
+        for table_idx, table in enumerate(doc.tables):
+            yield table_idx, self._iter_rows(table)
+
+    def iter_body(self, source) -> Iterator[TableRows]:
+        """Walk the body once in order, yielding tables (with their nested tables) and
+        runs of key/value paragraphs as (block_idx, rows) pairs"""
+        doc = Document(source)
+        block_idx = 0
+        paragraph_rows = []
+        for child in doc.element.body.iterchildren(W_P, W_TBL):
+            if child.tag == W_P:
+                row = paragraph_row(Paragraph(child, doc).text)
+                if row is not None:
+                    paragraph_rows.append(row)
+                continue
+
+            if paragraph_rows:
+                yield block_idx, iter(paragraph_rows)
+                block_idx += 1
+                paragraph_rows = []
+            yield block_idx, self._iter_body_table_rows(Table(child, doc))
+            block_idx += 1
+
+        if paragraph_rows:
+            yield block_idx, iter(paragraph_rows)
+
+    def _iter_body_table_rows(self, table, source: str = 'table') -> Iterator[TableRow]:
+        # Nested tables follow the row containing them; a merged cell's tables are read once
+        seen_tcs = set()
+        for row, docx_row in zip(self._iter_rows(table), table.rows):
+            row.source = source
+            yield row
+            for cell in docx_row.cells:
+                if cell._tc in seen_tcs:
+                    continue
+                seen_tcs.add(cell._tc)
+                for nested in cell.tables:
+                    yield from self._iter_body_table_rows(nested, 'nested')
+
+    @staticmethod
+    def _iter_rows(table) -> Iterator[TableRow]:
+        # python-docx hands back the same w:tc for every grid column it spans and for
+        # every vMerge continuation, so key the text extraction on the element itself
+        extracted: Dict[object, Tuple[str, str]] = {}
+        for row in table.rows:
+            raw, cells, spans = [], [], []
+            grid_col = row.grid_cols_before
+            previous_tc = None
+            for cell in row.cells:
+                tc = cell._tc
+                if tc is previous_tc:
+                    # Same w:tc repeated for the next grid column of a horizontal span
+                    spans[-1] = spans[-1]._replace(col_span=spans[-1].col_span + 1)
+                else:
+                    continued = tc in extracted
+                    if not continued:
+                        text = cell.text
+                        extracted[tc] = (text, normalize_cell_text(text))
+                    raw_text, text = extracted[tc]
+                    raw.append(raw_text)
+                    cells.append(text)
+                    spans.append(CellSpan(grid_col, 1, continued))
+                    previous_tc = tc
+                grid_col += 1
+            yield TableRow(raw, spans, cells=cells)
+
+
+class StreamingTableReader:
+    """Stream word/document.xml with lxml iterparse instead of building a python-docx Document.
+
+    Each w:tc is read once: a cell spanning several grid columns yields a single entry,
+    and a vMerge continuation cell reuses the text of the cell above it.
+    """
+    name = 'lxml'
+    lazy = True
+
+    def iter_tables(self, source) -> Iterator[TableRows]:
+        """Yield (table_idx, rows) for every top-level table in a DocxPackage, path or file object"""
+        if isinstance(source, DocxPackage):
+            yield from self._iter_package_tables(source)
+        else:
+            with DocxPackage(source) as package:
+                yield from self._iter_package_tables(package)
+
+    def iter_body(self, source) -> Iterator[TableRows]:
+        """Walk the body once in order, yielding tables (with their nested tables) and
+        runs of key/value paragraphs as (block_idx, rows) pairs"""
+        if isinstance(source, DocxPackage):
+            yield from self._iter_package_blocks(source, self._iter_body_records)
+        else:
+            with DocxPackage(source) as package:
+                yield from self._iter_package_blocks(package, self._iter_body_records)
+
+    def _iter_package_tables(self, package: DocxPackage) -> Iterator[TableRows]:
+        return self._iter_package_blocks(package, self._iter_top_level_rows)
+
+    def _iter_package_blocks(self, package: DocxPackage, record_source) -> Iterator[TableRows]:
+        with package.open_main_document() as stream:
+            records = record_source(stream)
+            for block_idx, (_, block_records) in enumerate(groupby(records, key=itemgetter(0))):
+                yield block_idx, self._iter_rows(block_records)
+
+    def _iter_top_level_rows(self, stream) -> Iterator[Tuple[etree._Element, etree._Element]]:
+        """Yield (tbl, tr) pairs for rows of body-level tables, freeing parsed XML as it goes"""
+        for _, elem in etree.iterparse(stream, events=('end',), tag=(W_TR, W_TBL), resolve_entities=False):
+            parent = elem.getparent()
+            if elem.tag == W_TBL:
+                # Drop finished body-level tables and the paragraphs before them
+                if parent is not None and parent.tag == W_BODY:
+                    self._release(elem)
+                continue
+
+            # Nested table rows stay in place; they are not part of doc.tables
+            if parent is None or parent.getparent() is None or parent.getparent().tag != W_BODY:
+                continue
+
+            yield parent, elem
+            self._release(elem)
+
+    def _iter_body_records(self, stream) -> Iterator[Tuple[object, object]]:
+        """Yield (block, record) pairs in document order for body-level tables, the tables
+        nested in their cells and key/value paragraphs between tables.
+
+        Top-level rows are yielded as w:tr elements so their text is only read if the
+        consumer asks for it; nested-table and paragraph rows are built as they end.
+        """
+        nested_rows: List[TableRow] = []
+        nested_above: Dict[etree._Element, Dict[int, Tuple[str, str]]] = {}
+        paragraph_block = None
+        for _, elem in etree.iterparse(stream, events=('end',), tag=(W_P, W_TR, W_TBL), resolve_entities=False):
+            parent = elem.getparent()
+            tag = elem.tag
+            if tag == W_P:
+                if parent is None or parent.tag != W_BODY:
+                    continue
+                row = paragraph_row(self._paragraph_text(elem))
+                if row is not None:
+                    if paragraph_block is None:
+                        paragraph_block = object()
+                    yield paragraph_block, row
+                self._release(elem)
+            elif tag == W_TBL:
+                if parent is not None and parent.tag == W_BODY:
+                    self._release(elem)
+                else:
+                    nested_above.pop(elem, None)
+            elif parent.getparent().tag == W_BODY:
+                paragraph_block = None
+                yield parent, elem
+                # Nested tables finished inside this row follow it in the stream
+                for row in nested_rows:
+                    yield parent, row
+                nested_rows = []
+                self._release(elem)
+            else:
+                row, nested_above[parent] = self._build_row(elem, nested_above.get(parent, {}))
+                row.source = 'nested'
+                nested_rows.append(row)
+
+    @staticmethod
+    def _release(elem):
+        """Free a finished element and everything before it under the same parent"""
+        parent = elem.getparent()
+        elem.clear()
+        while elem.getprevious() is not None:
+            del parent[0]
+
+    def _iter_rows(self, records) -> Iterator[TableRow]:
+        above: Dict[int, Tuple[str, str]] = {}
+        for _, record in records:
+            if isinstance(record, TableRow):
+                yield record
+            else:
+                row, above = self._build_row(record, above)
+                yield row
+
+    def _build_row(self, tr, above: Dict[int, Tuple[str, str]]) -> Tuple[TableRow, Dict[int, Tuple[str, str]]]:
+        """Map each w:tc of a row to one text extraction, resolving gridSpan and vMerge"""
+        raw, cells, spans = [], [], []
+        row_grid = {}
+        grid_col = self._grid_before(tr)
+        for tc in tr.iterchildren(W_TC):
+            span, v_merge = self._cell_props(tc)
+            continued = v_merge == 'continue'
+            if continued:
+                raw_text, text = above.get(grid_col, ('', ''))
+            else:
+                raw_text = self._cell_text(tc)
+                text = normalize_cell_text(raw_text)
+            row_grid[grid_col] = (raw_text, text)
+            raw.append(raw_text)
+            cells.append(text)
+            spans.append(CellSpan(grid_col, span, continued))
+            grid_col += span
+        return TableRow(raw, spans, cells=cells), row_grid
+
+    @staticmethod
+    def _grid_before(tr) -> int:
+        tr_pr = tr.find(W_TRPR)
+        if tr_pr is None:
+            return 0
+        grid_before = tr_pr.find(W_GRID_BEFORE)
+        return int(grid_before.get(W_VAL, 0)) if grid_before is not None else 0
+
+    @staticmethod
+    def _cell_props(tc) -> Tuple[int, str]:
+        """Return (grid span, vMerge value) for a w:tc element"""
+        tc_pr = tc.find(W_TCPR)
+        if tc_pr is None:
+            return 1, None
+        grid_span = tc_pr.find(W_GRID_SPAN)
+        v_merge = tc_pr.find(W_VMERGE)
+        span = int(grid_span.get(W_VAL, 1)) if grid_span is not None else 1
+        merge = v_merge.get(W_VAL, 'continue') if v_merge is not None else None
+        return max(span, 1), merge
+
+    @classmethod
+    def _cell_text(cls, tc) -> str:
+        """Text of the paragraphs directly inside a cell (nested tables excluded, as in python-docx)"""
+        return '\n'.join(cls._paragraph_text(p) for p in tc.iterchildren(W_P))
+
+    @staticmethod
+    def _paragraph_text(p) -> str:
+        parts = []
+        for child in p.iterchildren(W_R, W_HYPERLINK):
+            runs = (child,) if child.tag == W_R else child.iterchildren(W_R)
+            for run in runs:
+                for node in run:
+                    tag = node.tag
+                    if tag == W_T:
+                        parts.append(node.text or '')
+                    elif tag in (W_TAB, W_PTAB):
+                        parts.append('\t')
+                    elif tag == W_CR:
+                        parts.append('\n')
+                    elif tag == W_BR:
+                        # Page and column breaks carry no text in python-docx
+                        if node.get(W_TYPE, 'textWrapping') == 'textWrapping':
+                            parts.append('\n')
+                    elif tag == W_NO_BREAK_HYPHEN:
+                        parts.append('-')
+        return ''.join(parts)
+
+
+TABLE_READERS = {
+    StreamingTableReader.name: StreamingTableReader,
+    DocxTableReader.name: DocxTableReader,
+}
+
+
+def get_table_reader(name: str):
+    """Instantiate the table reader registered under `name`"""
+    try:
+        return TABLE_READERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown table reader '{name}'. Available: {', '.join(TABLE_READERS)}")
@@ -1,26 +1,16 @@
 from typing import List, Dict
-import re
 class DebugLogger:
     @staticmethod
-    def print_row_debug(row_idx: int, cells: list):
-        """Print debug information for a row"""
-        # Extract text from cells if they are _Cell objects
-        cell_texts = []
-        for cell in cells:
-            if hasattr(cell, 'text'):  # Check if it's a _Cell object
-                cell_text = cell.text.strip().replace('\n', ' ').replace('\t', ' ')
-                cell_text = re.sub(r'\s+', ' ', cell_text).strip()
-                cell_texts.append(cell_text)
-            else:
-                cell_texts.append(str(cell).strip())
-
-        print(f"  Row {row_idx + 1}: {len(cell_texts)} columns, {len([c for c in cell_texts if c])} non-empty")
-        for i, cell_text in enumerate(cell_texts):
-            if cell_text:
+    def print_row_debug(row_idx: int, row):
+        """Print debug information for a TableRow"""
+        source = f" [{row.source}]" if row.source != 'table' else ""
+        print(f"  Row {row_idx + 1}{source}: {row.num_cols} columns, {row.non_empty_count} non-empty")
+        for i, cell_text in enumerate(row.cells):
+            if row.non_empty[i]:
                 print(f"    Col {i+1}: '{cell_text[:50]}{'...' if len(cell_text) > 50 else ''}'")
     
     @staticmethod
-    def add_debug_info(table_idx: int, row_idx: int, method: str, key: str, value: str, cells: list) -> dict:
+    def add_debug_info(table_idx: int, row_idx: int, method: str, key: str, value: str, row) -> dict:
         """Create debug information entry"""
         return {
             'Table': table_idx + 1,
@@ -28,7 +18,7 @@ class DebugLogger:
             'Method': method,
             'Key': key,
             'Value': value[:100] + '...' if len(value) > 100 else value,
-            'Original_Cells': ' | '.join([f"Col{i+1}: {cell}" for i, cell in enumerate(cells) if cell.strip()])
+            'Original_Cells': ' | '.join([f"Col{i+1}: {cell}" for i, cell in enumerate(row.cells) if row.non_empty[i]])
         }
 
     @staticmethod
@@ -36,6 +26,46 @@ class DebugLogger:
         """Log processing date addition"""
         print(f"📅 Added processing date: {processing_date}")
 
+    @staticmethod
+    def log_package_read(bytes_read: int, file_size: int):
+        """Log how much of the .docx archive was read during extraction"""
+        share = (bytes_read / file_size * 100) if file_size else 0
+        print(f"📦 Read {bytes_read:,} of {file_size:,} bytes from the .docx ({share:.1f}%)")
+
+    @staticmethod
+    def log_early_exit(position, missing_fields: List[str]):
+        """Log whether traversal stopped early on required fields"""
+        if position:
+            table_idx, row_idx = position
+            print(f"⏹️ All required fields found at Table {table_idx + 1}, Row {row_idx + 1} - remaining rows skipped")
+        else:
+            print(f"⚠️ No early exit - missing required fields: {', '.join(missing_fields) or 'none'}")
+
+    @staticmethod
+    def log_table_skipped(table_idx: int, cached: bool):
+        """Log a table the classifier decided is not a terms table"""
+        source = "cached fingerprint" if cached else "first rows"
+        print(f"\n⏭️ Skipping Table {table_idx + 1}: not a terms table ({source})")
+
+    @staticmethod
+    def log_revision(key: str, reused_rows: int, total_rows: int, changed_fields: List[str]):
+        """Log incremental re-extraction results for a document revision"""
+        print(f"🔁 Revision '{key}': reused {reused_rows} of {total_rows} extracted rows")
+        if changed_fields:
+            print(f"    Changed fields: {', '.join(changed_fields)}")
+
+    @staticmethod
+    def log_result_cache_hit(key: str, stats: dict):
+        """Log a conversion served from the result cache"""
+        print(f"⚡ Result cache hit {key[:12]} - {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['memory_evictions'] + stats['disk_evictions']} evictions")
+
+    @staticmethod
+    def log_strategy_hits(hits: dict):
+        """Log how many rows each planned strategy handled"""
+        summary = ', '.join(f"{name}: {count}" for name, count in sorted(hits.items())) or "no rows"
+        print(f"🧭 Strategy plan - {summary}")
+
     @staticmethod
     def log_strategy_success(strategy_name: str, key: str, value: str):
         """Log successful strategy extraction"""
@@ -1,115 +1,228 @@
-import pandas as pd
-from typing import Dict, List, Any
+import os
+from typing import Dict, List, Sequence, Tuple
+from src.backend.app.utils.column_registry import ColumnRegistry
+from src.backend.app.utils.streaming_writer import StreamingExcelWriter
+
+COUPON_SHEET = "Coupon_Schedule"
+
+# pandas is only imported by the append path, which reads existing workbooks back;
+# writing a single document goes straight through xlsxwriter
 
 class ExcelWriter:
     @staticmethod
-    def write_to_excel(data_dict: Dict, xlsx_file_path: str, debug_info: List[Dict] = None, debug: bool = True):
-        """Handle Excel file writing and formatting"""
-        with pd.ExcelWriter(xlsx_file_path, engine='xlsxwriter') as writer:
-            # Create main data sheet
-            df = pd.DataFrame([data_dict])
-            df.to_excel(writer, sheet_name="Terms", index=False)
-            
-            # Format sheets
-            workbook = writer.book
-            ExcelWriter._format_main_sheet(df, writer, workbook)
-            
+    def write_to_excel(data_dict: Dict, xlsx_file_path, debug_info: List[Dict] = None, debug: bool = True,
+                       coupon_records: Sequence = None):
+        """
+        Write one document's workbook, formatting and sizing columns as cells are written
+        Args:
+            xlsx_file_path: Path of the workbook, or a binary file-like object to write it to
+        """
+        with StreamingExcelWriter(xlsx_file_path, debug=False) as writer:
+            # Main data sheet
+            writer.write_sheet("Terms", [data_dict], list(data_dict))
+
+            # Coupon schedule in long format, one row per coupon / cash-flow record
+            if coupon_records:
+                columns, rows = ExcelWriter._coupon_rows(coupon_records, terms_row=1)
+                writer.write_sheet(COUPON_SHEET, rows, columns, style='coupon')
+
             # Add debug sheet if requested
             if debug and debug_info:
-                debug_df = ExcelWriter._add_debug_sheet(debug_info, writer, workbook)
-                ExcelWriter._format_debug_sheet(debug_df, writer, workbook)
+                writer.write_sheet("Debug_Log", debug_info, style='debug')
 
     @staticmethod
-    def append_to_excel(data_to_append, xlsx_file_path: str, debug_info_to_append: list = None, debug: bool = True):
-        # Read existing data
+    def stream_to_excel(records, xlsx_file_path: str, columns=None, debug_records=None, debug: bool = True) -> int:
+        """
+        Write many Terms rows without holding them in memory (see StreamingExcelWriter)
+        Args:
+            records: Dicts of field name -> value, one per document, or a function returning
+                an iterator of them
+            columns: Terms header (a list or a ColumnRegistry); found in a first pass if None
+            debug_records: Debug_Log rows, written after Terms if debug is True
+        Returns:
+            int: Number of Terms rows written
+        """
+        with StreamingExcelWriter(xlsx_file_path, debug) as writer:
+            rows = writer.write_sheet("Terms", records, columns)
+            if debug and debug_records is not None:
+                writer.write_sheet("Debug_Log", debug_records, style='debug')
+        return rows
+
+    @staticmethod
+    def append_to_excel(data_to_append, xlsx_file_path: str, debug_info_to_append: list = None, debug: bool = True,
+                        coupon_records_to_append: Sequence = None):
+        """Append one document to an existing workbook (see append_batch_to_excel)"""
+        ExcelWriter.append_batch_to_excel(
+            xlsx_file_path, [(data_to_append, debug_info_to_append, coupon_records_to_append)], debug
+        )
+
+    @staticmethod
+    def append_batch_to_excel(xlsx_file_path: str, entries: Sequence[Tuple], debug: bool = True,
+                              registry: ColumnRegistry = None) -> ColumnRegistry:
+        """
+        Append several documents with one read and one write of the workbook
+        Args:
+            entries (list): (data_to_append, debug_info_to_append, coupon_records_to_append)
+                per document, in order. Terms data is a dict of field name -> value; fields
+                the workbook lacks become new columns, missing ones are left blank.
+            debug (bool): Append the debug rows to Debug_Log. When False, debug rows are
+                left out and an existing Debug_Log is copied cell by cell, without pandas.
+            registry (ColumnRegistry): Column layout to extend; built from the workbook if None
+        Returns:
+            ColumnRegistry: Columns and row count of the Terms sheet afterwards
+        """
+        import pandas as pd
+
+        # Read existing data; without new debug rows Debug_Log is only copied (see below)
+        sheets = ["Terms", COUPON_SHEET, "Debug_Log"] if debug else ["Terms", COUPON_SHEET]
+        existing = {sheet: pd.DataFrame() for sheet in sheets}
         try:
             with pd.ExcelFile(xlsx_file_path) as reader:
-                if "Terms" in reader.sheet_names:
-                    existing_df = pd.read_excel(reader, sheet_name="Terms")
-                else:
-                    existing_df = pd.DataFrame()
-                if "Debug_Log" in reader.sheet_names:
-                    existing_debug_df = pd.read_excel(reader, sheet_name="Debug_Log")
-                else:
-                    existing_debug_df = pd.DataFrame()
+                for sheet in sheets:
+                    if sheet in reader.sheet_names:
+                        existing[sheet] = pd.read_excel(reader, sheet_name=sheet)
         except FileNotFoundError:
-            existing_df = pd.DataFrame()
-            existing_debug_df = pd.DataFrame()
-
-        # Append main data (as a new row)
-        if data_to_append:
-            if existing_df.empty:
-                # First write, use keys from dict or raise error for list
-                if isinstance(data_to_append, dict):
-                    new_df = pd.DataFrame([data_to_append])
-                else:
-                    raise ValueError("Cannot append list of values to empty sheet; need column names.")
-            else:
-                # Align dict to existing columns
-                if isinstance(data_to_append, dict):
-                    row = {col: data_to_append.get(col, "") for col in existing_df.columns}
-                    new_df = pd.DataFrame([row])
-                elif isinstance(data_to_append, list) and len(data_to_append) == len(existing_df.columns):
-                    new_df = pd.DataFrame([data_to_append], columns=existing_df.columns)
-                elif isinstance(data_to_append, list) and isinstance(data_to_append[0], dict):
-                    rows = [{col: d.get(col, "") for col in existing_df.columns} for d in data_to_append]
-                    new_df = pd.DataFrame(rows)
-                elif isinstance(data_to_append, list) and isinstance(data_to_append[0], list):
-                    new_df = pd.DataFrame(data_to_append, columns=existing_df.columns)
-                else:
-                    raise ValueError("data_to_append shape does not match existing columns")
+            pass
+        existing_df, existing_coupon_df = existing["Terms"], existing[COUPON_SHEET]
+        existing_debug_df = existing.get("Debug_Log", pd.DataFrame())
+
+        if registry is None:
+            registry = ColumnRegistry()
+        if not existing_df.empty:
+            registry.add(existing_df.columns)
+        debug_columns = None if existing_debug_df.empty else existing_debug_df.columns
+        terms_row = len(existing_df)
+        rows, new_debug_dfs, new_coupon_dfs = [], [], []
+        for data_to_append, debug_info_to_append, coupon_records_to_append in entries:
+            # Append main data (as new rows, laid out by column name)
+            if data_to_append:
+                new_rows = ExcelWriter.terms_rows(data_to_append, registry)
+                terms_row += len(new_rows)
+                rows.extend(new_rows)
+
+            # Append debug info (as new rows)
+            if debug and debug_info_to_append:
+                new_debug_df = ExcelWriter._debug_frame(debug_info_to_append, debug_columns)
+                debug_columns = new_debug_df.columns
+                new_debug_dfs.append(new_debug_df)
+
+            # Coupon records point at the Terms row of the document they came from
+            if coupon_records_to_append and data_to_append:
+                new_coupon_dfs.append(ExcelWriter._coupon_frame(coupon_records_to_append, terms_row=terms_row))
+
+        if rows:
+            # Rows laid out before a column was registered are shorter; pad them blank
+            width = len(registry)
+            new_df = pd.DataFrame([row + [""] * (width - len(row)) for row in rows], columns=registry.columns)
             combined_df = pd.concat([existing_df, new_df], ignore_index=True)
         else:
             combined_df = existing_df
+        combined_debug_df = (pd.concat([existing_debug_df] + new_debug_dfs, ignore_index=True)
+                             if new_debug_dfs else existing_debug_df)
+        combined_coupon_df = (pd.concat([existing_coupon_df] + new_coupon_dfs, ignore_index=True)
+                              if new_coupon_dfs else existing_coupon_df)
 
-        # Append debug info (as new rows)
-        if debug and debug_info_to_append:
-            if existing_debug_df.empty:
-                new_debug_df = pd.DataFrame(debug_info_to_append)
-            else:
-                # Align each row to existing columns
-                if isinstance(debug_info_to_append[0], dict):
-                    rows = [{col: d.get(col, "") for col in existing_debug_df.columns} for d in debug_info_to_append]
-                    new_debug_df = pd.DataFrame(rows)
-                else:
-                    new_debug_df = pd.DataFrame(debug_info_to_append, columns=existing_debug_df.columns)
-            combined_debug_df = pd.concat([existing_debug_df, new_debug_df], ignore_index=True)
-        else:
-            combined_debug_df = existing_debug_df
-
-        # Write back to Excel
-        with pd.ExcelWriter(xlsx_file_path, engine='xlsxwriter') as writer:
+        # Write next to the target and swap it in, so a failed write leaves the workbook intact
+        root, extension = os.path.splitext(xlsx_file_path)
+        temporary_path = f"{root}.tmp{extension}"
+        with pd.ExcelWriter(temporary_path, engine='xlsxwriter') as writer:
             workbook = writer.book
             combined_df.to_excel(writer, sheet_name="Terms", index=False)
             ExcelWriter._format_main_sheet(combined_df, writer, workbook)
-            if debug and not combined_debug_df.empty:
+            if not combined_coupon_df.empty:
+                ExcelWriter._write_coupon_sheet(combined_coupon_df, writer, workbook)
+            if not debug:
+                ExcelWriter._copy_debug_sheet(xlsx_file_path, workbook)
+            elif not combined_debug_df.empty:
                 combined_debug_df.to_excel(writer, sheet_name="Debug_Log", index=False)
                 ExcelWriter._format_debug_sheet(combined_debug_df, writer, workbook)
+        os.replace(temporary_path, xlsx_file_path)
+        registry.add(combined_df.columns)
+        registry.rows = len(combined_df)
+        return registry
 
     @staticmethod
-    def _add_debug_sheet(debug_info: List[Dict], writer, workbook) -> Any:
-        """Add a debug sheet with detailed information"""
-        if debug_info:
-            debug_df = pd.DataFrame(debug_info)
-            debug_df.to_excel(writer, sheet_name="Debug_Log", index=False)
-            
-            # Format the debug sheet
-            worksheet = writer.sheets['Debug_Log']
-            header_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#F9CB9C',
-                'border': 1
-            })
-            
-            for col_num, column_name in enumerate(debug_df.columns.values):
-                worksheet.write(0, col_num, column_name, header_format)
-                max_length = max(
-                    len(str(column_name)),
-                    debug_df[column_name].astype(str).map(len).max() if not debug_df.empty else 0
-                )
-                worksheet.set_column(col_num, col_num, min(max_length + 2, 60))  # Cap at 60 characters
-            return debug_df
-        
+    def terms_rows(data_to_append, registry: ColumnRegistry) -> List[list]:
+        """
+        Terms rows for appended data, laid out on the registry's columns
+        Args:
+            data_to_append: A dict of field name -> value (new names are registered), a list
+                of such dicts, or positional values covering every registered column
+        Raises:
+            ValueError: If positional values do not match the registered columns
+        """
+        if isinstance(data_to_append, dict):
+            registry.add(data_to_append)
+            return [registry.row(data_to_append)]
+        if isinstance(data_to_append, list) and isinstance(data_to_append[0], dict):
+            rows = []
+            for values in data_to_append:
+                registry.add(values)
+                rows.append(registry.row(values))
+            return rows
+        if not len(registry):
+            raise ValueError("Cannot append list of values to empty sheet; need column names.")
+        if isinstance(data_to_append, list) and len(data_to_append) == len(registry):
+            return [list(data_to_append)]
+        if isinstance(data_to_append, list) and isinstance(data_to_append[0], list):
+            if any(len(values) != len(registry) for values in data_to_append):
+                raise ValueError("data_to_append shape does not match existing columns")
+            return [list(values) for values in data_to_append]
+        raise ValueError("data_to_append shape does not match existing columns")
+
+    @staticmethod
+    def _debug_frame(debug_info_to_append: list, columns=None):
+        """Debug_Log rows, aligned to the existing columns"""
+        import pandas as pd
+        if columns is None:
+            return pd.DataFrame(debug_info_to_append)
+        # Align each row to existing columns
+        if isinstance(debug_info_to_append[0], dict):
+            return pd.DataFrame([{col: d.get(col, "") for col in columns} for d in debug_info_to_append])
+        return pd.DataFrame(debug_info_to_append, columns=columns)
+
+    @staticmethod
+    def _text_width(column) -> int:
+        """Longest value of a column as text; blanks count as "nan" as they always have"""
+        return max((len(str(value)) for value in column), default=0)
+
+    @staticmethod
+    def _coupon_frame(coupon_records: Sequence, terms_row: int):
+        """
+        Long-format frame of coupon records, tagged with the 1-based Terms row they belong to
+        Args:
+            coupon_records (list): CouponRecords, or dicts of their fields
+        """
+        import pandas as pd
+        columns, rows = ExcelWriter._coupon_rows(coupon_records, terms_row)
+        return pd.DataFrame(rows, columns=columns)
+
+    @staticmethod
+    def _coupon_rows(coupon_records: Sequence, terms_row: int) -> Tuple[tuple, List[tuple]]:
+        """Coupon_Schedule header and rows for coupon records (see _coupon_frame)"""
+        first = coupon_records[0]
+        fields = tuple(first.keys()) if isinstance(first, dict) else type(first)._fields
+        values = [tuple(record.values()) if isinstance(record, dict) else tuple(record) for record in coupon_records]
+        columns = ('Terms_Row',) + tuple(field.title() for field in fields)
+        return columns, [(terms_row,) + row for row in values]
+
+    @staticmethod
+    def _write_coupon_sheet(coupon_df, writer, workbook):
+        """Write and format the Coupon_Schedule sheet"""
+        coupon_df.to_excel(writer, sheet_name=COUPON_SHEET, index=False)
+        worksheet = writer.sheets[COUPON_SHEET]
+        header_format = workbook.add_format({
+            'bold': True,
+            'bg_color': '#BDD7EE',
+            'border': 1
+        })
+        date_format = workbook.add_format({'num_format': 'dd-mm-yyyy'})
+        for col_num, column_name in enumerate(coupon_df.columns.values):
+            worksheet.write(0, col_num, column_name, header_format)
+            max_length = max(len(str(column_name)), ExcelWriter._text_width(coupon_df[column_name]))
+            cell_format = date_format if column_name == 'Date' else None
+            worksheet.set_column(col_num, col_num, min(max_length + 2, 60), cell_format)
+
     @staticmethod
     def _format_main_sheet(df, writer, workbook):
         """Format the main Terms sheet"""
@@ -143,11 +256,48 @@ class ExcelWriter:
                 # Calculate appropriate column width
                 max_length = max(
                     len(str(column_name)),
-                    df[column_name].astype(str).map(len).max() if not df.empty else 0
+                    ExcelWriter._text_width(df[column_name])
                 )
                 adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
                 worksheet.set_column(col_num, col_num, adjusted_width, data_format)
         
+    @staticmethod
+    def _copy_debug_sheet(xlsx_file_path: str, workbook):
+        """
+        Copy an existing Debug_Log into the workbook being written, cell values as they are
+        Args:
+            xlsx_file_path (str): Workbook to copy from; nothing is copied if it has no Debug_Log
+            workbook: xlsxwriter Workbook to copy into
+        """
+        from openpyxl import load_workbook
+
+        try:
+            source = load_workbook(xlsx_file_path, read_only=True)
+        except FileNotFoundError:
+            return
+        try:
+            if "Debug_Log" not in source.sheetnames:
+                return
+            worksheet = None
+            widths = []
+            for row_number, row in enumerate(source["Debug_Log"].iter_rows(values_only=True)):
+                if worksheet is None:
+                    worksheet = workbook.add_worksheet("Debug_Log")
+                    header_format = workbook.add_format({'bold': True, 'bg_color': '#F9CB9C', 'border': 1})
+                    worksheet.write_row(0, 0, row, header_format)
+                    widths = [len(str(value)) for value in row]
+                    continue
+                for col_num, value in enumerate(row):
+                    if value is None:
+                        continue
+                    worksheet.write(row_number, col_num, value)
+                    if col_num < len(widths):
+                        widths[col_num] = max(widths[col_num], len(str(value)))
+            for col_num, width in enumerate(widths):
+                worksheet.set_column(col_num, col_num, min(width + 2, 60))
+        finally:
+            source.close()
+
     @staticmethod
     def _format_debug_sheet(debug_df, writer, workbook):
         """Format the debug sheet"""
@@ -163,7 +313,7 @@ class ExcelWriter:
                 worksheet.write(0, col_num, column_name, header_format)
                 max_length = max(
                     len(str(column_name)),
-                    debug_df[column_name].astype(str).map(len).max() if not debug_df.empty else 0
+                    ExcelWriter._text_width(debug_df[column_name])
                 )
                 worksheet.set_column(col_num, col_num, min(max_length + 2, 60))
          
\ No newline at end of file
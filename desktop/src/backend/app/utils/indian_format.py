@@ -0,0 +1,160 @@
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    # Only the batch helpers need numpy, and they import it when called
+    import numpy as np
+
+PAISE_PER_RUPEE = 100
+RUPEES_PER_CRORE = 10000000
+# Amounts are shown to 0.01 crore
+_PAISE_PER_CRORE_HUNDREDTH = PAISE_PER_RUPEE * RUPEES_PER_CRORE // 100
+
+# Longest digit string that always fits an int64
+_INT64_DIGITS = 18
+
+
+@lru_cache(maxsize=4096, typed=True)
+def format_indian_number(number) -> str:
+    """
+    Group a number the Indian way: thousands, then every two digits
+    Example: 7162500 -> "71,62,500"
+    The same few amounts recur across documents, so results are memoized.
+    """
+    text = str(number)
+    if len(text) <= 3:
+        return text
+    sign = ''
+    if text[0] == '-':
+        sign, text = '-', text[1:]
+    whole, dot, fraction = text.partition('.')
+    if len(whole) > 3:
+        head = whole[:-3]
+        lead = len(head) % 2
+        groups = [head[:lead]] if lead else []
+        groups.extend(head[i:i + 2] for i in range(lead, len(head), 2))
+        groups.append(whole[-3:])
+        whole = ','.join(groups)
+    return sign + whole + dot + fraction
+
+
+def whole_rupees(number_text: str) -> int:
+    """
+    Integer part of a plain decimal number, without a round trip through float
+    Example: "95500.50" -> 95500
+    """
+    return int(str(number_text).partition('.')[0])
+
+
+def paise_product(*factors) -> int:
+    """
+    Exact product of rupee amounts and counts, in paise
+    Example: ("75", "95500.50") -> 716253750
+    Raises:
+        ValueError, ArithmeticError: If a factor is not a finite number
+    """
+    total = Fraction(PAISE_PER_RUPEE)
+    for factor in factors:
+        total *= Fraction(Decimal(str(factor).strip()))
+    # round() on a Fraction is exact and rounds half to even, like float formatting
+    return round(total)
+
+
+def format_crores(paise: int) -> str:
+    """
+    Express an amount in paise in crores, to two decimals
+    Example: 750000000 -> "Rs 0.75 crores"
+    """
+    hundredths = round(Fraction(paise, _PAISE_PER_CRORE_HUNDREDTH))
+    sign = '-' if hundredths < 0 else ''
+    whole, fraction = divmod(abs(hundredths), 100)
+    return f"Rs {sign}{whole:,}.{fraction:02d} crores"
+
+
+def crores_text(*factors) -> str:
+    """
+    Multiply rupee amounts and express the product in crores
+    Example: ("75", "100000") -> "Rs 0.75 crores"
+    """
+    try:
+        return format_crores(paise_product(*factors))
+    except (ValueError, TypeError, ArithmeticError) as e:
+        print(f"⚠️ Error calculating total value: {e}")
+        return "Rs 0 crores"
+
+
+# Batch versions work on whole arrays; values that do not fit int64 take the scalar path.
+# numpy is imported inside them, so single-document conversions never load it.
+
+def format_indian_number_batch(values: Iterable) -> 'np.ndarray':
+    """format_indian_number for an array of integers"""
+    import numpy as np
+    array = np.asarray(values)
+    if array.dtype.kind not in 'iu':
+        return np.array([format_indian_number(value) for value in array.tolist()], dtype=object)
+    negative = array < 0
+    text = _group_digits(np.abs(array), 2)
+    if negative.any():
+        text = np.where(negative, np.char.add('-', text), text)
+    return text.astype(object)
+
+
+def whole_rupees_batch(number_texts: Iterable[str]) -> 'np.ndarray':
+    """whole_rupees for an array of number strings; int64 when every value fits"""
+    import numpy as np
+    texts = np.asarray(number_texts, dtype=str)
+    wholes = np.char.partition(texts, '.')[..., 0] if texts.size else texts
+    if wholes.size and np.char.str_len(wholes).max() <= _INT64_DIGITS:
+        try:
+            return wholes.astype(np.int64)
+        except ValueError:
+            pass
+    return np.array([int(whole) for whole in wholes.tolist()], dtype=object)
+
+
+def format_crores_batch(paise: Iterable[int]) -> 'np.ndarray':
+    """format_crores for an array of amounts in paise"""
+    import numpy as np
+    array = np.asarray(paise)
+    if array.dtype.kind not in 'iu':
+        return np.array([format_crores(value) for value in array.tolist()], dtype=object)
+    magnitude = np.abs(array)
+    quotient, remainder = np.divmod(magnitude, _PAISE_PER_CRORE_HUNDREDTH)
+    # Round half to even, as format_crores does
+    twice = remainder * 2
+    round_up = (twice > _PAISE_PER_CRORE_HUNDREDTH) | ((twice == _PAISE_PER_CRORE_HUNDREDTH) & (quotient % 2 == 1))
+    whole, fraction = np.divmod(quotient + round_up, 100)
+    sign = np.where((array < 0) & (quotient + round_up > 0), '-', '')
+    text = np.char.add(np.char.add('Rs ', sign), _group_digits(whole, 3))
+    text = np.char.add(np.char.add(text, '.'), np.char.zfill(fraction.astype(str), 2))
+    return np.char.add(text, ' crores').astype(object)
+
+
+def _group_digits(values: 'np.ndarray', width: int) -> 'np.ndarray':
+    """
+    Comma-group non-negative integers: thousands first, then every `width` digits.
+    Numbers with the same digit count share their comma positions, so each length
+    is grouped in one step on a (numbers x digits) character array.
+    """
+    import numpy as np
+    digits = values.astype(str)
+    lengths = np.char.str_len(digits)
+    longest = int(lengths.max()) if lengths.size else 1
+    grouped = np.empty(digits.shape, dtype=f'U{longest + len(_comma_positions(longest, width))}')
+    for length in np.unique(lengths).tolist():
+        rows = lengths == length
+        commas = _comma_positions(length, width)
+        if not commas:
+            grouped[rows] = digits[rows]
+            continue
+        chars = digits[rows].astype(f'U{length}').view('U1').reshape(-1, length)
+        with_commas = np.insert(chars, commas, ',', axis=1)
+        grouped[rows] = with_commas.view(f'U{length + len(commas)}').ravel()
+    return grouped
+
+
+def _comma_positions(length: int, width: int) -> list:
+    """Offsets in a `length`-digit number before which a comma goes"""
+    return list(range(length - 3, 0, -width))[::-1]
@@ -0,0 +1,164 @@
+import math
+import os
+from datetime import date, datetime, time
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Union
+
+import xlsxwriter
+
+from src.backend.app.utils.column_registry import ColumnRegistry
+
+# Last row index Excel can hold
+MAX_EXCEL_ROW = 1048575
+
+# Header colour, column width cap and column format of each sheet, as ExcelWriter lays them out
+SHEET_STYLES: Dict[str, Dict] = {
+    'terms': {'header': {'bold': True, 'text_wrap': True, 'valign': 'top', 'bg_color': '#D7E4BC', 'border': 1},
+              'data': {'text_wrap': True, 'valign': 'top', 'border': 1},
+              'max_width': 50},
+    'debug': {'header': {'bold': True, 'bg_color': '#F9CB9C', 'border': 1}, 'max_width': 60},
+    'coupon': {'header': {'bold': True, 'bg_color': '#BDD7EE', 'border': 1}, 'max_width': 60,
+               'columns': {'Date': {'num_format': 'dd-mm-yyyy'}}},
+}
+
+# Written as they are; anything else is written as its str(), like pandas' to_excel does
+_CELL_TYPES = (str, int, float, date, datetime, time)
+
+# Records, or a function returning a fresh iterator of them for a header pass
+Records = Union[Iterable, Callable[[], Iterable]]
+
+
+class StreamingExcelWriter:
+    """Write records to a workbook one row at a time, in xlsxwriter's constant_memory mode.
+
+    Each row is flushed to disk as soon as the next one starts, so memory does not grow
+    with the number of rows; only the header and the column widths are kept. Rows must
+    therefore be written in order, and the header must be known before the first row:
+    pass `columns` (a list of names or a ColumnRegistry), or records that can be iterated
+    twice so a first pass can collect the field names.
+
+    The target may also be a file-like object such as BytesIO. The workbook is then built
+    in memory, which is what a single document needs anyway.
+
+    Usage:
+        with StreamingExcelWriter("consolidated.xlsx") as writer:
+            writer.write_sheet("Terms", records, columns=registry)
+    """
+
+    def __init__(self, xlsx_file_path, debug: bool = True):
+        """
+        Args:
+            xlsx_file_path: Path of the workbook, or a binary file-like object to write it to
+        """
+        self.xlsx_file_path = xlsx_file_path
+        self.debug = debug
+        options = {'default_date_format': 'dd-mm-yyyy'}
+        if isinstance(xlsx_file_path, (str, os.PathLike)):
+            # Written next to the target and swapped in on close, so a failed write leaves it intact
+            root, extension = os.path.splitext(xlsx_file_path)
+            self.temporary_path = f"{root}.tmp{extension}"
+            options['constant_memory'] = True
+            self.workbook = xlsxwriter.Workbook(self.temporary_path, options)
+        else:
+            self.temporary_path = None
+            options['in_memory'] = True
+            self.workbook = xlsxwriter.Workbook(xlsx_file_path, options)
+
+    def __enter__(self) -> 'StreamingExcelWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.workbook.close()
+            if self.temporary_path:
+                os.remove(self.temporary_path)
+
+    def write_sheet(self, sheet_name: str, records: Records, columns: Union[Sequence[str], ColumnRegistry] = None,
+                    style: str = 'terms') -> int:
+        """
+        Write a sheet of records, one row each, below a header
+        Args:
+            records: Dicts of column name -> value, or lists of values in column order.
+                A function returning an iterator of records may be given instead.
+            columns: Header; collected from the dict records in a first pass if None.
+                A sheet without columns is left empty.
+            style (str): 'terms', 'debug' or 'coupon' formatting (see SHEET_STYLES)
+        Returns:
+            int: Number of data rows written
+        Raises:
+            ValueError: If a record does not fit the header
+        """
+        if columns is None:
+            columns = self._first_pass(records)
+        elif isinstance(columns, ColumnRegistry):
+            columns = columns.columns
+        columns = list(columns)
+        worksheet = self.workbook.add_worksheet(sheet_name)
+        if not columns:
+            return 0
+        index = {name: position for position, name in enumerate(columns)}
+
+        layout = SHEET_STYLES[style]
+        worksheet.write_row(0, 0, columns, self.workbook.add_format(layout['header']))
+        widths = [len(str(name)) for name in columns]
+
+        row_number = unknown = 0
+        for record in _iterate(records):
+            row_number += 1
+            if row_number > MAX_EXCEL_ROW:
+                raise ValueError(f"Sheet {sheet_name} has more rows than Excel allows")
+            if isinstance(record, Mapping):
+                cells = [None] * len(columns)
+                for name, value in record.items():
+                    position = index.get(name)
+                    if position is None:
+                        unknown += 1
+                    else:
+                        cells[position] = value
+            else:
+                cells = list(record)
+                if len(cells) > len(columns):
+                    raise ValueError(f"Row {row_number} of sheet {sheet_name} has more values than columns")
+            for position, value in enumerate(cells):
+                if value is None or value == "" or (isinstance(value, float) and math.isnan(value)):
+                    continue
+                if not isinstance(value, _CELL_TYPES):
+                    value = str(value)
+                worksheet.write(row_number, position, value)
+                width = len(str(value))
+                if width > widths[position]:
+                    widths[position] = width
+
+        data_format = self.workbook.add_format(layout['data']) if 'data' in layout else None
+        column_formats = {name: self.workbook.add_format(properties)
+                          for name, properties in layout.get('columns', {}).items()}
+        for position, width in enumerate(widths):
+            cell_format = column_formats.get(columns[position], data_format)
+            worksheet.set_column(position, position, min(width + 2, layout['max_width']), cell_format)
+        if self.debug:
+            print(f"📝 Streamed {row_number} rows to {sheet_name}")
+            if unknown:
+                print(f"⚠️ Skipped {unknown} values of fields not in the {sheet_name} header")
+        return row_number
+
+    def close(self):
+        self.workbook.close()
+        if self.temporary_path:
+            os.replace(self.temporary_path, self.xlsx_file_path)
+
+    @staticmethod
+    def _first_pass(records: Records) -> List[str]:
+        """Field names of dict records in first-seen order"""
+        if not callable(records) and iter(records) is records:
+            raise ValueError("Records can only be read once; pass columns or a re-iterable source")
+        registry = ColumnRegistry()
+        for record in _iterate(records):
+            if not isinstance(record, Mapping):
+                raise ValueError("Cannot write list of values without column names.")
+            registry.add(record)
+        return registry.columns
+
+
+def _iterate(records: Records) -> Iterable:
+    return records() if callable(records) else records
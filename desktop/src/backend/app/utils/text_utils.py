@@ -1,3 +1,6 @@
+from src.backend.app.utils.indian_format import format_indian_number, whole_rupees
+from src.backend.app.utils.number_tokens import tokenize_numbers
+
 # Add this function near the top of the file
 def extract_series_number(product_code):
     """Extract series number from product code"""
@@ -24,16 +27,11 @@ def extract_issue_size_number(issue_size):
                 total amounting to Rs.71,62,500/-"
     Example output: ("75", "71,62,500")
     """
-    import re
-    
     if not issue_size:
         return ("", "")
     
-    # Remove all commas first
-    cleaned_text = issue_size.replace(',', '')
-    
-    # Find all numbers (including decimals) in the text
-    numbers = re.findall(r'\d+\.?\d*', cleaned_text)
+    # All numbers (including decimals) in the text, commas removed
+    numbers = [token.number for token in tokenize_numbers(issue_size)]
     
     # Get first number (issue size)
     issue_size_num = numbers[0] if numbers else ""
@@ -43,32 +41,9 @@ def extract_issue_size_number(issue_size):
     if len(numbers) >= 4:
         total_amount = numbers[3]
         try:
-            amount = int(float(total_amount))
+            amount = whole_rupees(total_amount)
             formatted_amount = format_indian_number(amount)
         except (ValueError, TypeError):
             pass
     
     return (issue_size_num, formatted_amount)
-
-def format_indian_number(number):
-    """Helper function to format number with Indian style commas"""
-    str_num = str(number)
-    length = len(str_num)
-    
-    if length <= 3:
-        return str_num
-    
-    # Split the number into parts
-    last_three = str_num[-3:]
-    remaining = str_num[:-3]
-    
-    # Add commas every 2 digits in the remaining part
-    formatted = ''
-    for i, digit in enumerate(reversed(remaining)):
-        if i % 2 == 1 and i != len(remaining) - 1:
-            formatted = ',' + digit + formatted
-        else:
-            formatted = digit + formatted
-    
-    return formatted + ',' + last_three
-
@@ -3,6 +3,7 @@ from tkinter import messagebox
 from tkcalendar import Calendar
 from src.components.status_panel import StatusPanel
 from src.backend.app.core.root_dir_setup import get_output_directory
+from src.backend.app.core.output_sinks import OUTPUT_SINKS
 import os
 import datetime
 
@@ -159,9 +160,33 @@ class ProcessingPanel(ctk.CTkFrame):
         self.sep4 = ctk.CTkFrame(self, height=2, fg_color=self._get_separator_color())
         self.sep4.grid(row=7, column=0, sticky="ew", padx=8, pady=(0, 4))
 
+        # --- Output Format Section ---
+        self.format_frame = ctk.CTkFrame(self, **AppTheme.get_frame_style())
+        self.format_frame.grid(row=8, column=0, sticky="ew", padx=12, pady=4)
+        self.format_frame.grid_columnconfigure(1, weight=1)
+
+        self.format_label = ctk.CTkLabel(
+            self.format_frame, text="Output Format:",
+            **AppTheme.get_label_style(font=AppTheme.FONTS["heading"])
+        )
+        self.format_label.grid(row=0, column=0, padx=12, pady=10, sticky="w")
+        # xlsx is the styled workbook; the other formats hold the Terms row only
+        self.format_menu = ctk.CTkOptionMenu(
+            self.format_frame,
+            values=list(OUTPUT_SINKS),
+            width=120,
+            font=AppTheme.FONTS["normal"]
+        )
+        self.format_menu.set("xlsx")
+        self.format_menu.grid(row=0, column=2, padx=12, pady=10, sticky="e")
+
+        # --- Separator ---
+        self.sep6 = ctk.CTkFrame(self, height=2, fg_color=self._get_separator_color())
+        self.sep6.grid(row=9, column=0, sticky="ew", padx=8, pady=(0, 4))
+
         # --- Process Button Section ---
         self.button_frame = ctk.CTkFrame(self, **AppTheme.get_frame_style())
-        self.button_frame.grid(row=8, column=0, sticky="ew", padx=12, pady=4)
+        self.button_frame.grid(row=10, column=0, sticky="ew", padx=12, pady=4)
        
        # Process Button
         self.process_button = ctk.CTkButton(
@@ -183,11 +208,11 @@ class ProcessingPanel(ctk.CTkFrame):
 
         # --- Separator ---
         self.sep5 = ctk.CTkFrame(self, height=2, fg_color=self._get_separator_color())
-        self.sep5.grid(row=9, column=0, sticky="ew", padx=8, pady=(0, 4))
+        self.sep5.grid(row=11, column=0, sticky="ew", padx=8, pady=(0, 4))
 
         # --- Status Panel Section ---
         self.status_panel = StatusPanel(self)
-        self.status_panel.grid(row=10, column=0, padx=16, pady=16, sticky="nsew")
+        self.status_panel.grid(row=12, column=0, padx=16, pady=16, sticky="nsew")
 
     def _get_separator_color(self):
         return AppTheme.get_separator_color()
@@ -248,7 +273,8 @@ class ProcessingPanel(ctk.CTkFrame):
         
         # Generate timestamp
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_excel = os.path.join(self.output_path, f"converted_{timestamp}.xlsx")
+        output_format = self.format_menu.get()
+        output_file = os.path.join(self.output_path, f"converted_{timestamp}{OUTPUT_SINKS[output_format].extension}")
         
         processing_date = self.date_entry.get().strip()  # Get date from entry
 
@@ -257,11 +283,17 @@ class ProcessingPanel(ctk.CTkFrame):
             self.status_panel.set_progress(0.5)  # Show progress
 
             # Pass processing_date as third argument
-            self.process_callback(self.selected_docx, output_excel, processing_date, self.append_file_path)
+            self.process_callback(self.selected_docx, output_file, processing_date, self.append_file_path,
+                                  output_format)
             self.status_panel.set_progress(1.0)  # Complete progress
+            message = "Document processed successfully!"
+            if self.append_file_path:
+                # Appends are journaled and written to the master in batches
+                message += (f"\nIts row is queued for {os.path.basename(self.append_file_path)} and written "
+                            "with the next batch of appends, or when the app is closed.")
             self.status_panel.update_status("Document processed successfully!", "success")
 
-            messagebox.showinfo("Success", "Document processed successfully!")
+            messagebox.showinfo("Success", message)
         except Exception as e:
             self.status_panel.set_progress(0)  # Reset progress
             self.status_panel.update_status(f"Error: {str(e)}", "error")
@@ -303,6 +335,7 @@ class ProcessingPanel(ctk.CTkFrame):
         self.sep3.configure(fg_color=separator_color)
         self.sep4.configure(fg_color=separator_color)
         self.sep5.configure(fg_color=separator_color)
+        self.sep6.configure(fg_color=separator_color)
 
         # Update labels
         self._update_label_colors()
@@ -316,6 +349,7 @@ class ProcessingPanel(ctk.CTkFrame):
         self.docx_label.configure(text_color=colors["text"])
         self.date_label.configure(text_color=colors["text"])
         self.append_label.configure(text_color=colors["text"])
+        self.format_label.configure(text_color=colors["text"])
         
         # Update path labels with appropriate colors based on selection state
         self.docx_path_label.configure(
@@ -1,4 +1,5 @@
 import customtkinter as ctk
+from tkinter import messagebox
 from src.components.processing_panel import ProcessingPanel
 from src.utils.config import AppConfig
 from src.utils.theme import AppTheme
@@ -21,8 +22,16 @@ class MainWindow(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
         
         # Initialize document processor
+        from src.backend.app.core.config import RESULT_CACHE_DESKTOP_DIR
         from src.backend.app.core.document_processor_new import DocumentProcessor
-        self.doc_processor = DocumentProcessor(debug=AppConfig.DEBUG_MODE)
+        from src.backend.app.core.result_cache import ResultCache
+        # Appends are written to the master workbook right away, so it holds every
+        # document the UI reports as processed
+        self.doc_processor = DocumentProcessor(
+            debug=AppConfig.DEBUG_MODE,
+            result_cache=ResultCache(directory=RESULT_CACHE_DESKTOP_DIR),
+            defer_appends=True
+        )
         
         # Create a scrollable frame for the processing panel
         self.scrollable_frame = ctk.CTkScrollableFrame(self)
@@ -45,17 +54,30 @@ class MainWindow(ctk.CTk):
         self.processing_panel.pack(fill="both", expand=True)
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-    def process_document(self, input_path: str, output_path: str, processing_date: str, append_file_path=None):
+    def process_document(self, input_path: str, output_path: str, processing_date: str, append_file_path=None,
+                         output_format=None):
         """Callback for document processing"""
         return self.doc_processor.convert_docx_to_xlsx(
             docx_file_path=input_path,
             xlsx_file_path=output_path,
             processing_date=processing_date,
-            append_to_file=append_file_path
+            append_to_file=append_file_path,
+            output_format=output_format
         )
     
     def on_closing(self):
         """Clean up resources and close the window"""
+        try:
+            # Documents still journaled for master workbooks
+            self.doc_processor.flush_appends()
+        except Exception as e:
+            print(f"⚠️ Could not write pending appends: {e}")
+            messagebox.showerror(
+                "Error",
+                f"Pending rows could not be written to the master workbook: {e}\n"
+                "They stay in the .journal file next to it and are written with the next "
+                "batch of appends to that workbook."
+            )
         AppTheme.cleanup()  # Clean up theme management
         self.quit()
         self.destroy()
\ No newline at end of file